@@ -450,6 +450,10 @@ def execute_tool_call(function_to_call, function_args_str: str) -> str:
         task = progress.add_task("running", total=None)
         tool_result = function_to_call(**function_args)
 
+    # Pre-encoded JSON (e.g. from orjson) only needs decoding, not re-encoding
+    if isinstance(tool_result, bytes):
+        tool_result = tool_result.decode("utf-8")
+
     # Ensure the result is a string
     if not isinstance(tool_result, str):
         warning_msg = "[warning]Warning: Tool "
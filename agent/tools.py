@@ -43,8 +43,8 @@ def get_available_functions(messages=None) -> Dict[str, Any]:
         
         # Check each Python file in the subdirectory
         for filename in os.listdir(subdir_path):
-            # Skip non-Python files and __init__.py
-            if not filename.endswith('.py') or filename == '__init__.py':
+            # Skip non-Python files, __init__.py and private helper modules
+            if not filename.endswith('.py') or filename.startswith('_'):
                 continue
             
             module_name = f"agent.tools.{subdir}.{filename[:-3]}"  # Remove .py extension
@@ -96,8 +96,8 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
         
         # Check each Python file in the subdirectory
         for filename in os.listdir(subdir_path):
-            # Skip non-Python files and __init__.py
-            if not filename.endswith('.py') or filename == '__init__.py':
+            # Skip non-Python files, __init__.py and private helper modules
+            if not filename.endswith('.py') or filename.startswith('_'):
                 continue
             
             module_name = f"agent.tools.{subdir}.{filename[:-3]}"  # Remove .py extension
@@ -47,58 +47,61 @@ def load_messages(filename: str, use_focus_path: bool = True):
     })
 
 
-def get_tool_definition():
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "dump_messages",
-                "description": "Saves the current conversation to a file so it can be continued later. "
-                               "The conversation will be saved in JSON format.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "filename": {
-                            "type": "string",
-                            "description": "The name of the file to save the conversation to. "
-                                           "If not provided, a timestamped filename will be used. "
-                                           "E.g., 'my_conversation.json'",
-                        },
-                        "use_focus_path": {
-                            "type": "boolean",
-                            "description": "Whether to use the focus path as the base directory. "
-                                           "If true (default), the file will be saved relative to the focus directory "
-                                           "if one is set. If false, it will be saved relative to the current working directory.",
-                            "default": True,
-                        }
+_TOOL_DEFINITION = [
+    {
+        "type": "function",
+        "function": {
+            "name": "dump_messages",
+            "description": "Saves the current conversation to a file so it can be continued later. "
+                           "The conversation will be saved in JSON format.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "filename": {
+                        "type": "string",
+                        "description": "The name of the file to save the conversation to. "
+                                       "If not provided, a timestamped filename will be used. "
+                                       "E.g., 'my_conversation.json'",
                     },
-                    "required": [],
+                    "use_focus_path": {
+                        "type": "boolean",
+                        "description": "Whether to use the focus path as the base directory. "
+                                       "If true (default), the file will be saved relative to the focus directory "
+                                       "if one is set. If false, it will be saved relative to the current working directory.",
+                        "default": True,
+                    }
                 },
+                "required": [],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "load_messages",
-                "description": "Loads a previously saved conversation from a file to continue where you left off.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "filename": {
-                            "type": "string",
-                            "description": "The name of the file to load the conversation from. "
-                                           "E.g., 'my_conversation.json'",
-                        },
-                        "use_focus_path": {
-                            "type": "boolean",
-                            "description": "Whether to use the focus path as the base directory. "
-                                           "If true (default), the file will be loaded relative to the focus directory "
-                                           "if one is set. If false, it will be loaded relative to the current working directory.",
-                            "default": True,
-                        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "load_messages",
+            "description": "Loads a previously saved conversation from a file to continue where you left off.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "filename": {
+                        "type": "string",
+                        "description": "The name of the file to load the conversation from. "
+                                       "E.g., 'my_conversation.json'",
                     },
-                    "required": ["filename"],
+                    "use_focus_path": {
+                        "type": "boolean",
+                        "description": "Whether to use the focus path as the base directory. "
+                                       "If true (default), the file will be loaded relative to the focus directory "
+                                       "if one is set. If false, it will be loaded relative to the current working directory.",
+                        "default": True,
+                    }
                 },
+                "required": ["filename"],
             },
-        }
-    ]
+        },
+    }
+]
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,7 +1,77 @@
 import json
+import logging
 import os
 import shutil
-import traceback
+import stat
+import sys
+import threading
+
+from agent.tools.shared.path_utils import is_within_dir, pending_deletion_name
+
+logger = logging.getLogger(__name__)
+
+# rmtree's onerror= is deprecated in favour of onexc= since Python 3.12
+_RMTREE_HAS_ONEXC = sys.version_info >= (3, 12)
+
+# Hidden trees whose background removal failed, reported by the next call
+_FAILED_DELETIONS = []
+_FAILED_LOCK = threading.Lock()
+
+
+def _rmtree_in_background(path):
+    """
+    Detach a directory from its path and remove its contents on a worker thread.
+
+    The directory is first renamed to a hidden sibling, which is a single
+    rename() on the same filesystem, so the original path disappears
+    immediately. shutil.rmtree (fd-based on platforms that support it) then
+    runs on a non-daemon thread so interpreter shutdown still waits for it.
+    Falls back to a synchronous rmtree if the rename is not possible.
+
+    If the background removal fails, the error is logged and the leftover
+    hidden tree is recorded so the next delete_directory call can report it.
+
+    Args:
+        path (str): Absolute path of the directory to delete
+
+    Returns:
+        bool: True if the contents are still being removed in the background,
+        False if they were removed synchronously
+    """
+    parent_dir, name = os.path.split(path)
+    trash_path = os.path.join(parent_dir, pending_deletion_name(name))
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        shutil.rmtree(path)
+        return False
+
+    def _on_exc(func, failed_path, exc):
+        logger.error("Error deleting '%s' in background: %s", failed_path, exc)
+
+    def _on_error(func, failed_path, exc_info):
+        _on_exc(func, failed_path, exc_info[1])
+
+    def _remove():
+        if _RMTREE_HAS_ONEXC:
+            shutil.rmtree(trash_path, onexc=_on_exc)
+        else:
+            shutil.rmtree(trash_path, onerror=_on_error)
+        if os.path.lexists(trash_path):
+            logger.error("Background deletion of '%s' left '%s' behind", path, trash_path)
+            with _FAILED_LOCK:
+                _FAILED_DELETIONS.append({"directory": path, "leftover_path": trash_path})
+
+    threading.Thread(target=_remove, name=f"delete_directory:{name}").start()
+    return True
+
+
+def _take_failed_deletions():
+    """Returns and forgets the background deletions that left trees behind."""
+    with _FAILED_LOCK:
+        failed = list(_FAILED_DELETIONS)
+        _FAILED_DELETIONS.clear()
+    return failed
 
 
 def delete_directory(directory_path: str):
@@ -12,9 +82,7 @@ def delete_directory(directory_path: str):
     Returns:
         str: A JSON string indicating success or an error message.
     """
-    print(
-        f"--- TOOL EXECUTING: delete_directory(directory_path='{directory_path}') ---"
-    )
+    logger.debug("delete_directory(directory_path=%r)", directory_path)
     try:
         if not isinstance(directory_path, str):
             return json.dumps(
@@ -28,9 +96,10 @@ def delete_directory(directory_path: str):
         base_dir = os.getcwd()
         resolved_path = os.path.abspath(os.path.join(base_dir, directory_path))
 
-        if not resolved_path.startswith(base_dir):
-            print(
-                f"Security Alert: Attempt to delete directory '{resolved_path}' outside of base directory '{base_dir}'."
+        if not is_within_dir(resolved_path, base_dir):
+            logger.warning(
+                "Security Alert: Attempt to delete directory '%s' outside of base directory '%s'.",
+                resolved_path, base_dir,
             )
             return json.dumps(
                 {
@@ -39,7 +108,11 @@ def delete_directory(directory_path: str):
                     "status": "error",
                 })
 
-        if not os.path.exists(resolved_path):
+        # lstat() so that a symlink is not followed; rmtree refuses links
+        # (and junctions on Windows), so they are rejected before the rename
+        try:
+            st = os.lstat(resolved_path)
+        except FileNotFoundError:
             return json.dumps(
                 {
                     "directory_path": directory_path,
@@ -47,7 +120,15 @@ def delete_directory(directory_path: str):
                     "message": f"Directory '{resolved_path}' not found.",
                 }
             )
-        if not os.path.isdir(resolved_path):
+        if stat.S_ISLNK(st.st_mode) or getattr(os.path, "isjunction", lambda _: False)(resolved_path):
+            return json.dumps(
+                {
+                    "directory_path": directory_path,
+                    "status": "error",
+                    "message": f"Path '{resolved_path}' is a symbolic link, not a directory.",
+                }
+            )
+        if not stat.S_ISDIR(st.st_mode):
             return json.dumps(
                 {
                     "directory_path": directory_path,
@@ -66,17 +147,27 @@ def delete_directory(directory_path: str):
                 }
             )
 
-        shutil.rmtree(resolved_path)
-        return json.dumps(
-            {
-                "directory_path": directory_path,
-                "status": "success",
-                "message": f"Directory '{resolved_path}' and its contents deleted successfully.",
-            })
+        in_background = _rmtree_in_background(resolved_path)
+        if in_background:
+            message = (
+                f"Directory '{resolved_path}' removed; its contents are being "
+                "deleted in the background."
+            )
+        else:
+            message = f"Directory '{resolved_path}' and its contents deleted successfully."
+        result = {
+            "directory_path": directory_path,
+            "status": "success",
+            "message": message,
+            "background": in_background,
+        }
+        failed = _take_failed_deletions()
+        if failed:
+            result["failed_background_deletions"] = failed
+        return json.dumps(result)
 
     except Exception as e:
-        print(f"Error in delete_directory: {e}")
-        traceback.print_exc()
+        logger.exception("Error in delete_directory")
         return json.dumps(
             {
                 "error": str(e),
@@ -86,20 +177,23 @@ def delete_directory(directory_path: str):
         )
 
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "delete_directory",
-            "description": "Deletes a specified directory and all its contents. Paths are relative to the current working directory.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "directory_path": {
-                        "type": "string",
-                        "description": "The relative path to the directory to delete. e.g., 'old_folder' or 'temp_data'",
-                    }},
-                "required": ["directory_path"],
-            },
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "delete_directory",
+        "description": "Deletes a specified directory and all its contents. Paths are relative to the current working directory.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "The relative path to the directory to delete. e.g., 'old_folder' or 'temp_data'",
+                }},
+            "required": ["directory_path"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,6 +1,10 @@
 import json
+import logging
 import os
-import traceback
+
+from agent.tools.shared.path_utils import is_within_dir
+
+logger = logging.getLogger(__name__)
 
 
 def delete_file(file_path: str):
@@ -11,7 +15,7 @@ def delete_file(file_path: str):
     Returns:
         str: A JSON string indicating success or an error message.
     """
-    print(f"--- TOOL EXECUTING: delete_file(file_path='{file_path}') ---")
+    logger.debug("delete_file(file_path=%r)", file_path)
     try:
         if not isinstance(file_path, str):
             return json.dumps(
@@ -25,9 +29,10 @@ def delete_file(file_path: str):
         base_dir = os.getcwd()
         resolved_path = os.path.abspath(os.path.join(base_dir, file_path))
 
-        if not resolved_path.startswith(base_dir):
-            print(
-                f"Security Alert: Attempt to delete file '{resolved_path}' outside of base directory '{base_dir}'."
+        if not is_within_dir(resolved_path, base_dir):
+            logger.warning(
+                "Security Alert: Attempt to delete file '%s' outside of base directory '%s'.",
+                resolved_path, base_dir,
             )
             return json.dumps(
                 {
@@ -63,27 +68,29 @@ def delete_file(file_path: str):
         )
 
     except Exception as e:
-        print(f"Error in delete_file: {e}")
-        traceback.print_exc()
+        logger.exception("Error in delete_file")
         return json.dumps(
             {"error": str(e), "file_path": file_path, "status": "error"}
         )
 
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "delete_file",
-            "description": "Deletes a specified file. File paths are relative to the current working directory.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "The relative path to the file to delete. e.g., 'old_document.txt' or 'temp/data.bak'",
-                    }},
-                "required": ["file_path"],
-            },
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "delete_file",
+        "description": "Deletes a specified file. File paths are relative to the current working directory.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file to delete. e.g., 'old_document.txt' or 'temp/data.bak'",
+                }},
+            "required": ["file_path"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
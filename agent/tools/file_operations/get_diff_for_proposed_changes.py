@@ -1,13 +1,15 @@
 import difflib
 import json
+import logging
 import os
-import traceback
+import sys
 
-import colorama
 from agent.tools.shared.path_utils import resolve_path
 
-# Initialize colorama for colored output in the terminal
-colorama.init()
+logger = logging.getLogger(__name__)
+
+# colorama is only initialized on first use, and only when stdout is a TTY
+_color_initialized = False
 
 
 class TermColors:
@@ -27,10 +29,27 @@ class TermColors:
     UNDERLINE = "\033[4m"
 
 
+def _use_color():
+    """
+    Initialize colorama the first time colored output is needed.
+
+    Returns:
+        bool: True if stdout is a TTY and the diff should be colorized
+    """
+    global _color_initialized
+    if not sys.stdout.isatty():
+        return False
+    if not _color_initialized:
+        import colorama
+        colorama.init()
+        _color_initialized = True
+    return True
+
+
 def get_diff_for_proposed_changes(file_path: str, proposed_new_content: str, use_focus_path: bool = True):
     """
     Calculates and returns a colored diff between a file's current content and
-    proposed new content.
+    proposed new content. Color codes are only added when stdout is a TTY.
     
     Args:
         file_path (str): The path to the file (relative to base directory).
@@ -40,20 +59,20 @@ def get_diff_for_proposed_changes(file_path: str, proposed_new_content: str, use
     Returns:
         str: A JSON string containing the colored diff or an error message.
     """
-    log_msg = "--- TOOL EXECUTING: get_diff_for_proposed_changes"
-    log_msg += "(file_path='{}', ".format(file_path)
-    log_msg += "proposed_content_length={}, ".format(len(proposed_new_content))
-    log_msg += "use_focus_path={}) ---".format(use_focus_path)
-    print(log_msg)
+    logger.debug(
+        "get_diff_for_proposed_changes(file_path=%r, proposed_content_length=%s, use_focus_path=%s)",
+        file_path, len(proposed_new_content), use_focus_path,
+    )
 
     try:
         # Resolve the path using the shared utility
         resolved_path, base_dir, is_in_base_dir = resolve_path(file_path, use_focus_path)
 
         if not is_in_base_dir:
-            alert_msg = "Security Alert: Attempt to access file "
-            alert_msg += f"'{resolved_path}' outside of base directory '{base_dir}'."
-            print(alert_msg)
+            logger.warning(
+                "Security Alert: Attempt to access file '%s' outside of base directory '%s'.",
+                resolved_path, base_dir,
+            )
             return json.dumps(
                 {
                     "error": "Access denied: File path is outside the allowed directory.",
@@ -70,11 +89,9 @@ def get_diff_for_proposed_changes(file_path: str, proposed_new_content: str, use
             else:
                 # If the file doesn't exist, the diff will show the entire new
                 # content as additions
-                print(f"Note: File '{resolved_path}' does not exist. Diff will show all content as new.")
+                logger.debug("File '%s' does not exist. Diff will show all content as new.", resolved_path)
         except Exception as e:
-            warn_msg = "Warning: Could not read original file for diff "
-            warn_msg += "'{}': {}".format(resolved_path, e)
-            print(warn_msg)
+            logger.warning("Could not read original file for diff '%s': %s", resolved_path, e)
             # Proceed with empty original_content to show full new content as
             # diff
 
@@ -83,22 +100,26 @@ def get_diff_for_proposed_changes(file_path: str, proposed_new_content: str, use
 
         diff = difflib.unified_diff(original_lines, proposed_lines, lineterm="")
 
-        colored_diff_lines = []
-        for line in diff:
-            if line.startswith("+"):
-                colored_diff_lines.append(
-                    "{0}{1}{2}".format(TermColors.GREEN, line, TermColors.RESET)
-                )
-            elif line.startswith("-"):
-                colored_diff_lines.append(
-                    "{0}{1}{2}".format(TermColors.RED, line, TermColors.RESET)
-                )
-            elif line.startswith("@"):
-                colored_diff_lines.append(
-                    "{0}{1}{2}".format(TermColors.CYAN, line, TermColors.RESET)
-                )
-            else:
-                colored_diff_lines.append(line)
+        if _use_color():
+            colored_diff_lines = []
+            for line in diff:
+                if line.startswith("+"):
+                    colored_diff_lines.append(
+                        "{0}{1}{2}".format(TermColors.GREEN, line, TermColors.RESET)
+                    )
+                elif line.startswith("-"):
+                    colored_diff_lines.append(
+                        "{0}{1}{2}".format(TermColors.RED, line, TermColors.RESET)
+                    )
+                elif line.startswith("@"):
+                    colored_diff_lines.append(
+                        "{0}{1}{2}".format(TermColors.CYAN, line, TermColors.RESET)
+                    )
+                else:
+                    colored_diff_lines.append(line)
+        else:
+            # Plain diff for non-TTY (programmatic) callers
+            colored_diff_lines = list(diff)
 
         colored_diff = "\n".join(colored_diff_lines)
 
@@ -122,46 +143,48 @@ def get_diff_for_proposed_changes(file_path: str, proposed_new_content: str, use
         )
 
     except Exception as e:
-        print("Error in get_diff_for_proposed_changes: {}".format(e))
-        traceback.print_exc()
+        logger.exception("Error in get_diff_for_proposed_changes")
         return json.dumps(
             {"error": str(e), "file_path": file_path, "status": "error"}
         )
 
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "get_diff_for_proposed_changes",
-            "description": "Compares proposed new content for a file with its current "
-                           "content on disk and returns a unified diff (colorized for "
-                           "terminal display). This helps visualize changes before they "
-                           "are written. Paths are relative to the current working "
-                           "directory or focus directory if one is set.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "The relative path to the file being changed "
-                                       "or created.",
-                    },
-                    "proposed_new_content": {
-                        "type": "string",
-                        "description": "The full proposed new content for the file.",
-                    },
-                    "use_focus_path": {
-                        "type": "boolean",
-                        "description": "Whether to use the focus path as the base directory. "
-                        "If true (default), paths are relative to the focus directory if one is set. "
-                        "If false, paths are always relative to the current working directory.",
-                        "default": True,
-                    }
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "get_diff_for_proposed_changes",
+        "description": "Compares proposed new content for a file with its current "
+                       "content on disk and returns a unified diff (colorized for "
+                       "terminal display). This helps visualize changes before they "
+                       "are written. Paths are relative to the current working "
+                       "directory or focus directory if one is set.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file being changed "
+                                   "or created.",
                 },
-                "required": [
-                    "file_path",
-                    "proposed_new_content"],
+                "proposed_new_content": {
+                    "type": "string",
+                    "description": "The full proposed new content for the file.",
+                },
+                "use_focus_path": {
+                    "type": "boolean",
+                    "description": "Whether to use the focus path as the base directory. "
+                    "If true (default), paths are relative to the focus directory if one is set. "
+                    "If false, paths are always relative to the current working directory.",
+                    "default": True,
+                }
             },
+            "required": [
+                "file_path",
+                "proposed_new_content"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
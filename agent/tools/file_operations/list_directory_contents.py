@@ -1,169 +1,239 @@
-import json
+import logging
 import os
-import traceback
+import stat
 
-from agent.tools.shared.path_utils import resolve_path
-from agent.tools.shared.gitignore_parser import parse_gitignore, is_ignored
+from agent.tools.shared.path_utils import is_pending_deletion, resolve_path
+from agent.tools.shared.gitignore_parser import parse_gitignore
+from agent.tools.shared.json_utils import json_tool
 
+logger = logging.getLogger(__name__)
 
-def list_directory_contents(directory_path: str = ".", use_focus_path: bool = True, respect_gitignore: bool = True):
+# Common directories that are always ignored when respecting gitignore
+_ALWAYS_IGNORED = frozenset([
+    "venv", ".venv", ".git", "__pycache__", "node_modules", ".mypy_cache", ".pytest_cache",
+])
+
+
+@json_tool
+def list_directory_contents(
+    directory_path: str = ".",
+    use_focus_path: bool = True,
+    respect_gitignore: bool = True,
+    limit: int = 1000,
+    offset: int = 0,
+    details: bool = True,
+):
     """
     Lists the contents (files and subdirectories) of a specified directory.
+
+    Entries are sorted by name and returned at most `limit` at a time; when
+    more remain, the result is marked truncated and carries the offset of
+    the next page.
     
     Args:
         directory_path (str): The path to the directory to list (relative to base directory).
         use_focus_path (bool): Whether to use the focus path as base directory.
         respect_gitignore (bool): Whether to respect .gitignore patterns and filter out ignored files.
+        limit (int): Maximum number of entries to return. Defaults to 1000.
+        offset (int): Number of (non-ignored) entries to skip. Defaults to 0.
+        details (bool): Whether to return {"name", "type"} objects. If False,
+            only names are returned.
         
     Returns:
         str: A JSON string representing the directory contents or an error.
     """
-    print(
-        f"--- TOOL EXECUTING: list_directory_contents(directory_path='{directory_path}', "
-        f"use_focus_path={use_focus_path}, respect_gitignore={respect_gitignore}) ---"
+    logger.debug(
+        "list_directory_contents(directory_path=%r, use_focus_path=%s, respect_gitignore=%s, "
+        "limit=%s, offset=%s, details=%s)",
+        directory_path, use_focus_path, respect_gitignore, limit, offset, details,
     )
     try:
         if not isinstance(directory_path, str):
-            return json.dumps(
-                {
-                    "error": "Invalid directory_path type, must be a string.",
-                    "path_received": str(directory_path),
-                    "status": "error",
-                }
-            )
+            return {
+                "error": "Invalid directory_path type, must be a string.",
+                "path_received": str(directory_path),
+                "status": "error",
+            }
+        if not isinstance(limit, int) or limit < 1 or not isinstance(offset, int) or offset < 0:
+            return {
+                "error": "Invalid pagination: limit must be a positive integer and offset a non-negative integer.",
+                "path": directory_path,
+                "status": "error",
+            }
 
         # Resolve the path using the shared utility
         resolved_path, base_dir, is_in_base_dir = resolve_path(directory_path, use_focus_path)
 
         if not is_in_base_dir:
-            print(
-                f"Security Alert: Attempt to access path '{resolved_path}' outside of base directory '{base_dir}'."
-            )
-            return json.dumps(
-                {
-                    "error": "Access denied: Path is outside the allowed directory.",
-                    "path": directory_path,
-                    "base_directory": base_dir,
-                    "status": "error",
-                }
+            logger.warning(
+                "Security Alert: Attempt to access path '%s' outside of base directory '%s'.",
+                resolved_path, base_dir,
             )
+            return {
+                "error": "Access denied: Path is outside the allowed directory.",
+                "path": directory_path,
+                "base_directory": base_dir,
+                "status": "error",
+            }
 
-        if not os.path.exists(resolved_path):
-            return json.dumps(
-                {
-                    "error": "Directory not found.", 
-                    "path": directory_path,
-                    "resolved_path": resolved_path,
-                    "status": "error",
-                }
-            )
-        if not os.path.isdir(resolved_path):
-            return json.dumps(
-                {
-                    "error": "The specified path is not a directory.",
-                    "path": resolved_path,
-                    "status": "error",
-                }
-            )
+        # One stat() answers both existence and type
+        try:
+            st = os.stat(resolved_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return {
+                "error": "Directory not found.", 
+                "path": directory_path,
+                "resolved_path": resolved_path,
+                "status": "error",
+            }
+        if not stat.S_ISDIR(st.st_mode):
+            return {
+                "error": "The specified path is not a directory.",
+                "path": resolved_path,
+                "status": "error",
+            }
 
         # Get gitignore patterns if needed
-        patterns = []
+        patterns = None
         if respect_gitignore:
             patterns = parse_gitignore(base_dir)
-            print(f"Using gitignore patterns: {patterns}")
+            logger.debug("Using gitignore patterns: %s", patterns.patterns)
+            # Patterns are matched against paths relative to base_dir
+            rel_dir = os.path.relpath(resolved_path, base_dir)
+            if rel_dir == os.curdir:
+                rel_dir = ""
 
-        contents = os.listdir(resolved_path)
-        detailed_contents = []
+        entries = []
         ignored_count = 0
-        
-        for item in contents:
-            item_path = os.path.join(resolved_path, item)
-            rel_path = os.path.join(directory_path, item)
-            
-            # Determine if item should be ignored
-            should_ignore = False
-            if respect_gitignore:
-                should_ignore = is_ignored(item_path, patterns)
-                
-                # Handle common directories that should always be ignored
-                if item in ["venv", ".git", "__pycache__", "node_modules"]:
-                    should_ignore = True
-                
-            if should_ignore:
-                ignored_count += 1
-                print(f"Ignoring: {item_path}")
-                continue
-                
-            item_type = "directory" if os.path.isdir(item_path) else "file"
-            detailed_contents.append({"name": item, "type": item_type})
+
+        # scandir's entries carry the file type from readdir, so classifying
+        # them does not need a stat() per item
+        with os.scandir(resolved_path) as it:
+            for entry in it:
+                # A directory delete_directory is still removing is not content
+                if is_pending_deletion(entry.name):
+                    continue
+
+                # Follows symlinks, so a link to a directory is listed as one.
+                # The type is only needed for details or directory patterns.
+                is_dir = entry.is_dir() if details or respect_gitignore else None
+
+                # Determine if item should be ignored; the name check is a
+                # set lookup, so it runs before the pattern match
+                should_ignore = False
+                if respect_gitignore:
+                    should_ignore = (
+                        entry.name in _ALWAYS_IGNORED
+                        or patterns.is_ignored(os.path.join(rel_dir, entry.name), is_dir=is_dir)
+                    )
+
+                if should_ignore:
+                    ignored_count += 1
+                    continue
+
+                entries.append((entry.name, is_dir))
+
+        # readdir order is unspecified and can change as entries are added
+        # or removed, so pages are cut from a sorted listing to keep
+        # next_offset stable
+        entries.sort()
+        page = entries[offset:offset + limit]
+        truncated = offset + len(page) < len(entries)
+
+        if details:
+            detailed_contents = [
+                {"name": name, "type": "directory" if is_dir else "file"}
+                for name, is_dir in page
+            ]
+        else:
+            detailed_contents = [name for name, _ in page]
 
         if not detailed_contents:
             message = "The directory is empty."
-            if ignored_count > 0:
+            if entries:
+                message = f"No entries at offset {offset}; the directory only lists {len(entries)} item(s)."
+            elif ignored_count > 0:
                 message = f"The directory has {ignored_count} item(s), but all are ignored by gitignore patterns."
                 
-            return json.dumps(
-                {
-                    "path": directory_path,
-                    "resolved_path": resolved_path,
-                    "contents": [],
-                    "ignored_count": ignored_count,
-                    "message": message,
-                    "status": "success",
-                }
-            )
-
-        return json.dumps(
-            {
+            return {
                 "path": directory_path,
                 "resolved_path": resolved_path,
-                "contents": detailed_contents,
+                "contents": [],
                 "ignored_count": ignored_count,
+                "message": message,
                 "status": "success",
             }
-        )
+
+        result = {
+            "path": directory_path,
+            "resolved_path": resolved_path,
+            "contents": detailed_contents,
+            "ignored_count": ignored_count,
+            "truncated": truncated,
+            "status": "success",
+        }
+        if truncated:
+            result["next_offset"] = offset + len(detailed_contents)
+        return result
 
     except Exception as e:
-        print(f"Error in list_directory_contents: {e}")
-        traceback.print_exc()
-        return json.dumps(
-            {
-                "error": str(e), 
-                "path": directory_path,
-                "status": "error",
-            }
-        )
+        logger.exception("Error in list_directory_contents")
+        return {
+            "error": str(e), 
+            "path": directory_path,
+            "status": "error",
+        }
 
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "list_directory_contents",
-            "description": "Lists the files and subdirectories within a specified directory path. Paths are relative to the current working directory or focus directory if one is set.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "directory_path": {
-                        "type": "string",
-                        "description": "The path to the directory to inspect. e.g., '.', 'example_dir'",
-                    },
-                    "use_focus_path": {
-                        "type": "boolean",
-                        "description": "Whether to use the focus path as the base directory. "
-                        "If true (default), paths are relative to the focus directory if one is set. "
-                        "If false, paths are always relative to the current working directory.",
-                        "default": True,
-                    },
-                    "respect_gitignore": {
-                        "type": "boolean",
-                        "description": "Whether to respect .gitignore patterns and filter out ignored files. "
-                        "If true (default), ignores files matching patterns in .gitignore. "
-                        "If false, lists all files in the directory.",
-                        "default": True,
-                    }
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "list_directory_contents",
+        "description": "Lists the files and subdirectories within a specified directory path. Paths are relative to the current working directory or focus directory if one is set.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "The path to the directory to inspect. e.g., '.', 'example_dir'",
+                },
+                "use_focus_path": {
+                    "type": "boolean",
+                    "description": "Whether to use the focus path as the base directory. "
+                    "If true (default), paths are relative to the focus directory if one is set. "
+                    "If false, paths are always relative to the current working directory.",
+                    "default": True,
+                },
+                "respect_gitignore": {
+                    "type": "boolean",
+                    "description": "Whether to respect .gitignore patterns and filter out ignored files. "
+                    "If true (default), ignores files matching patterns in .gitignore. "
+                    "If false, lists all files in the directory.",
+                    "default": True,
                 },
-                "required": ["directory_path"],
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of entries to return (default 1000). "
+                    "If more remain, the result has truncated=true and a next_offset.",
+                    "default": 1000,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of entries to skip, e.g. the next_offset of a previous call (default 0).",
+                    "default": 0,
+                },
+                "details": {
+                    "type": "boolean",
+                    "description": "Whether to include each entry's type. "
+                    "If false, only entry names are returned.",
+                    "default": True,
+                }
             },
+            "required": ["directory_path"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,41 +1,80 @@
 import glob
-import json
 import os
 import shutil
+import stat
 
+from agent.tools.shared.json_utils import json_tool
 
-def get_tool_definition():
+# Characters that make a source path a glob pattern
+_GLOB_CHARS = frozenset("*?[]")
+
+
+def _stat_or_none(path):
+    """Stats a path, following symlinks, or returns None if that fails."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _move(source, destination, destination_st):
     """
-    Define the move_files tool for the OpenAI function calling API.
+    Moves source to destination, renaming directly when nothing is in the way.
+
+    shutil.move stats the destination again before it tries os.rename; when
+    the destination is known not to exist the rename is attempted first, and
+    shutil.move only handles the cross-device copy-and-delete case.
+
+    Args:
+        source (str): Path to move
+        destination (str): Target path
+        destination_st (os.stat_result or None): Result of stat()ing destination
     """
-    return {
-        "type": "function",
-        "function": {
-            "name": "move_files",
-            "description": "Move files or folders from source path to destination, supporting wildcards",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "source_path": {
-                        "type": "string",
-                        "description": "Source path with optional wildcard (*, ?, [seq], [!seq]) patterns",
-                    },
-                    "destination_path": {
-                        "type": "string",
-                        "description": "Destination path (directory for wildcards, specific path for single file)",
-                    },
-                    "overwrite": {
-                        "type": "boolean",
-                        "description": "Whether to overwrite files at destination if they exist. Default is False.",
-                        "default": False,
-                    },
+    if destination_st is None:
+        try:
+            os.rename(source, destination)
+            return
+        except OSError:
+            pass
+    shutil.move(source, destination)
+
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "move_files",
+        "description": "Move files or folders from source path to destination, supporting wildcards",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "source_path": {
+                    "type": "string",
+                    "description": "Source path with optional wildcard (*, ?, [seq], [!seq]) patterns",
+                },
+                "destination_path": {
+                    "type": "string",
+                    "description": "Destination path (directory for wildcards, specific path for single file)",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Whether to overwrite files at destination if they exist. Default is False.",
+                    "default": False,
                 },
-                "required": ["source_path", "destination_path"],
             },
+            "required": ["source_path", "destination_path"],
         },
-    }
+    },
+}
+
 
+def get_tool_definition():
+    """
+    Define the move_files tool for the OpenAI function calling API.
+    """
+    return _TOOL_DEFINITION
 
+
+@json_tool
 def move_files(source_path, destination_path, overwrite=False):
     """
     Move files or folders from source path to destination, supporting wildcards.
@@ -54,40 +93,41 @@ def move_files(source_path, destination_path, overwrite=False):
         abs_destination_path = os.path.abspath(destination_path)
 
         # Check if source_path has wildcards
-        has_wildcards = any(c in source_path for c in ["*", "?", "[", "]"])
+        has_wildcards = not _GLOB_CHARS.isdisjoint(source_path)
 
         if has_wildcards:
             # Handle wildcard pattern in source path
             matched_paths = glob.glob(abs_source_path, recursive=True)
 
             if not matched_paths:
-                return json.dumps(
-                    {
-                        "warning": True,
-                        "message": f"No files found matching pattern '{abs_source_path}'.",
-                    }
-                )
+                return {
+                    "warning": True,
+                    "message": f"No files found matching pattern '{abs_source_path}'.",
+                }
 
             # Destination must be a directory for multiple files
-            if len(matched_paths) > 1 and not os.path.isdir(
-                abs_destination_path
-            ):
+            if len(matched_paths) > 1:
                 # Create destination directory if it doesn't exist
                 try:
                     os.makedirs(abs_destination_path, exist_ok=True)
                 except Exception as e:
-                    return json.dumps(
-                        {
-                            "error": f"Cannot create destination directory '{abs_destination_path}': {str(e)}"
-                        }
-                    )
+                    return {
+                        "error": f"Cannot create destination directory '{abs_destination_path}': {str(e)}"
+                    }
 
-            # Process each matched item
+            # Moving items into the destination does not change its type,
+            # so it is checked once rather than for every item
+            destination_is_dir = os.path.isdir(abs_destination_path)
+
+            # Process each matched item, counting outcomes as they are recorded
             results = []
+            counts = {"success": 0, "error": 0, "skipped": 0}
             for item_path in matched_paths:
                 item_name = os.path.basename(item_path)
+                source_st = _stat_or_none(item_path)
+                source_is_dir = source_st is not None and stat.S_ISDIR(source_st.st_mode)
                 # For multiple files, determine the destination for each file
-                if os.path.isdir(abs_destination_path):
+                if destination_is_dir:
                     item_destination = os.path.join(
                         abs_destination_path, item_name
                     )
@@ -95,7 +135,8 @@ def move_files(source_path, destination_path, overwrite=False):
                     item_destination = abs_destination_path
 
                 # Check if destination exists and handle accordingly
-                if os.path.exists(item_destination):
+                destination_st = _stat_or_none(item_destination)
+                if destination_st is not None:
                     if not overwrite:
                         results.append(
                             {
@@ -104,13 +145,12 @@ def move_files(source_path, destination_path, overwrite=False):
                                 "status": "skipped",
                                 "message": "Destination exists and overwrite is False.",
                             })
+                        counts["skipped"] += 1
                         continue
 
                     # If overwrite is True but destination is a directory and source is a file (or vice versa),
                     # we cannot overwrite without removing first
-                    if os.path.isdir(item_destination) != os.path.isdir(
-                        item_path
-                    ):
+                    if stat.S_ISDIR(destination_st.st_mode) != source_is_dir:
                         results.append(
                             {
                                 "source": item_path,
@@ -118,21 +158,21 @@ def move_files(source_path, destination_path, overwrite=False):
                                 "status": "error",
                                 "message": "Cannot overwrite: source and destination are different types (file/directory).",
                             })
+                        counts["error"] += 1
                         continue
 
                 # Move the item
                 try:
-                    # For directories, we use shutil.move
-                    # For files, we use shutil.move as well
-                    shutil.move(item_path, item_destination)
+                    _move(item_path, item_destination, destination_st)
 
                     results.append(
                         {
                             "source": item_path,
                             "destination": item_destination,
                             "status": "success",
-                            "message": f"{'Directory' if os.path.isdir(item_path) else 'File'} moved successfully.",
+                            "message": f"{'Directory' if source_is_dir else 'File'} moved successfully.",
                         })
+                    counts["success"] += 1
                 except Exception as e:
                     results.append(
                         {
@@ -142,75 +182,60 @@ def move_files(source_path, destination_path, overwrite=False):
                             "message": f"Error moving: {str(e)}",
                         }
                     )
+                    counts["error"] += 1
 
-            return json.dumps(
-                {
-                    "results": results,
-                    "total": len(matched_paths),
-                    "success": sum(
-                        1 for r in results if r["status"] == "success"
-                    ),
-                    "errors": sum(1 for r in results if r["status"] == "error"),
-                    "skipped": sum(
-                        1 for r in results if r["status"] == "skipped"
-                    ),
-                }
-            )
+            return {
+                "results": results,
+                "total": len(matched_paths),
+                "success": counts["success"],
+                "errors": counts["error"],
+                "skipped": counts["skipped"],
+            }
 
         else:
             # Single file or directory move (no wildcards)
-            if not os.path.exists(abs_source_path):
-                return json.dumps(
-                    {
-                        "error": f"Source path '{abs_source_path}' does not exist."
-                    }
-                )
+            source_st = _stat_or_none(abs_source_path)
+            if source_st is None:
+                return {
+                    "error": f"Source path '{abs_source_path}' does not exist."
+                }
+            source_is_dir = stat.S_ISDIR(source_st.st_mode)
 
             # Check if destination exists and handle accordingly
-            if os.path.exists(abs_destination_path):
+            destination_st = _stat_or_none(abs_destination_path)
+            if destination_st is not None:
                 if not overwrite:
-                    return json.dumps(
-                        {
-                            "warning": True,
-                            "message": f"Destination '{abs_destination_path}' already exists and overwrite is False.",
-                        })
+                    return {
+                        "warning": True,
+                        "message": f"Destination '{abs_destination_path}' already exists and overwrite is False.",
+                    }
 
                 # If overwrite is True but destination is a directory and source is a file (or vice versa),
                 # we cannot overwrite without removing first
-                if os.path.isdir(abs_destination_path) != os.path.isdir(
-                    abs_source_path
-                ):
-                    return json.dumps(
-                        {
-                            "error": "Cannot overwrite: source and destination are different types (file/directory)."
-                        }
-                    )
+                if stat.S_ISDIR(destination_st.st_mode) != source_is_dir:
+                    return {
+                        "error": "Cannot overwrite: source and destination are different types (file/directory)."
+                    }
 
             # Make sure parent directory of destination exists
             parent_dir = os.path.dirname(abs_destination_path)
-            if parent_dir and not os.path.exists(parent_dir):
+            if parent_dir:
                 try:
                     os.makedirs(parent_dir, exist_ok=True)
                 except Exception as e:
-                    return json.dumps(
-                        {
-                            "error": f"Cannot create parent directory for destination: {str(e)}"
-                        }
-                    )
+                    return {
+                        "error": f"Cannot create parent directory for destination: {str(e)}"
+                    }
 
             # Move the item
             try:
-                shutil.move(abs_source_path, abs_destination_path)
-                return json.dumps(
-                    {
-                        "success": True,
-                        "message": f"{'Directory' if os.path.isdir(abs_source_path) else 'File'} moved from '{abs_source_path}' to '{abs_destination_path}'.",
-                    }
-                )
+                _move(abs_source_path, abs_destination_path, destination_st)
+                return {
+                    "success": True,
+                    "message": f"{'Directory' if source_is_dir else 'File'} moved from '{abs_source_path}' to '{abs_destination_path}'.",
+                }
             except Exception as e:
-                return json.dumps(
-                    {"error": f"Error moving file/directory: {str(e)}"}
-                )
+                return {"error": f"Error moving file/directory: {str(e)}"}
 
     except Exception as e:
-        return json.dumps({"error": f"An unexpected error occurred: {str(e)}"})
+        return {"error": f"An unexpected error occurred: {str(e)}"}
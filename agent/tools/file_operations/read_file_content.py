@@ -1,126 +1,175 @@
-import json
+import logging
 import os
-import traceback
+import stat
 
 from agent.tools.shared.path_utils import resolve_path
+from agent.tools.shared.json_utils import json_tool
 
+logger = logging.getLogger(__name__)
 
-def read_file_content(file_path: str, use_focus_path: bool = True):
+
+@json_tool
+def read_file_content(file_path: str, use_focus_path: bool = True, offset: int = 0, length: int = None):
     """
     Reads the content of a specified file, optionally using the focus path.
+
+    Large files can be read in pieces by passing offset and length; only the
+    requested byte range is then read from disk.
     
     Args:
         file_path (str): The path to the file to read (relative to base directory).
         use_focus_path (bool): Whether to use the focus path as base directory.
+        offset (int): Byte offset to start reading from. Defaults to 0.
+        length (int, optional): Maximum number of bytes to read. Defaults to
+            None, which reads to the end of the file.
         
     Returns:
         str: A JSON string containing the file content or an error message.
     """
-    print(f"--- TOOL EXECUTING: read_file_content(file_path='{file_path}', use_focus_path={use_focus_path}) ---")
+    logger.debug(
+        "read_file_content(file_path=%r, use_focus_path=%s, offset=%s, length=%s)",
+        file_path, use_focus_path, offset, length,
+    )
     MAX_FILE_SIZE_WARN = 1024 * 1024  # 1MB, for console warning
     try:
         if not isinstance(file_path, str):
-            return json.dumps(
-                {
-                    "error": "Invalid file_path type, must be a string.",
-                    "path_received": str(file_path),
-                    "status": "error",
-                }
-            )
+            return {
+                "error": "Invalid file_path type, must be a string.",
+                "path_received": str(file_path),
+                "status": "error",
+            }
+        if offset is None:
+            offset = 0
+        if not isinstance(offset, int) or offset < 0 or (
+            length is not None and (not isinstance(length, int) or length < 0)
+        ):
+            return {
+                "error": "Invalid range: offset and length must be non-negative integers.",
+                "file_path": file_path,
+                "status": "error",
+            }
 
         # Resolve the path using the shared utility
         resolved_path, base_dir, is_in_base_dir = resolve_path(file_path, use_focus_path)
 
         if not is_in_base_dir:
-            alert_msg = "Security Alert: Attempt to read file "
-            alert_msg += f"'{resolved_path}' outside of base directory '{base_dir}'."
-            print(alert_msg)
-            return json.dumps(
-                {
-                    "error": "Access denied: File path is outside the allowed directory.",
-                    "file_path": file_path,
-                    "base_directory": base_dir,
-                    "status": "error",
-                })
-
-        if not os.path.exists(resolved_path):
-            return json.dumps(
-                {
-                    "error": "File not found.",
-                    "file_path": file_path,
-                    "resolved_path": resolved_path,
-                    "status": "error",
-                }
-            )
-        if not os.path.isfile(resolved_path):
-            return json.dumps(
-                {
-                    "error": "The specified path is not a file.",
-                    "file_path": resolved_path,
-                    "status": "error",
-                }
+            logger.warning(
+                "Security Alert: Attempt to read file '%s' outside of base directory '%s'.",
+                resolved_path, base_dir,
             )
+            return {
+                "error": "Access denied: File path is outside the allowed directory.",
+                "file_path": file_path,
+                "base_directory": base_dir,
+                "status": "error",
+            }
 
-        file_size = os.path.getsize(resolved_path)
-        if file_size > MAX_FILE_SIZE_WARN:
-            warn_msg = f"Warning: File '{resolved_path}' is large "
-            warn_msg += f"({file_size / (1024):.2f} KB). Reading entire content."
-            print(warn_msg)
+        # One stat() answers existence, type and size
+        try:
+            st = os.stat(resolved_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return {
+                "error": "File not found.",
+                "file_path": file_path,
+                "resolved_path": resolved_path,
+                "status": "error",
+            }
+        if not stat.S_ISREG(st.st_mode):
+            return {
+                "error": "The specified path is not a file.",
+                "file_path": resolved_path,
+                "status": "error",
+            }
 
-        with open(resolved_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+        file_size = st.st_size
 
-        content_to_return = content  # No truncation
+        if offset or length is not None:
+            # Read only the requested range; a multi-byte character split at
+            # either end of the range is dropped, as with errors="ignore"
+            with open(resolved_path, "rb") as f:
+                f.seek(offset)
+                data = f.read(-1 if length is None else length)
 
-        return json.dumps(
-            {
+            return {
                 "file_path": file_path,
                 "resolved_path": resolved_path,
-                "content": content_to_return,
+                "content": data.decode("utf-8", errors="ignore"),
+                "offset": offset,
+                "bytes_read": len(data),
+                "file_size": file_size,
+                "has_more": offset + len(data) < file_size,
                 "status": "success",
             }
-        )
+
+        if file_size > MAX_FILE_SIZE_WARN:
+            logger.warning(
+                "File '%s' is large (%.2f KB). Reading entire content; "
+                "pass offset/length to read it in pieces.",
+                resolved_path, file_size / 1024,
+            )
+
+        with open(resolved_path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+
+        content_to_return = content  # No truncation
+
+        return {
+            "file_path": file_path,
+            "resolved_path": resolved_path,
+            "content": content_to_return,
+            "file_size": file_size,
+            "status": "success",
+        }
 
     except FileNotFoundError:
-        return json.dumps(
-            {
-                "error": "File not found during read operation.",
-                "file_path": file_path,
-                "status": "error",
-            }
-        )
+        return {
+            "error": "File not found during read operation.",
+            "file_path": file_path,
+            "status": "error",
+        }
     except Exception as e:
-        print(f"Error in read_file_content: {e}")
-        traceback.print_exc()
-        return json.dumps(
-            {"error": str(e), "file_path": file_path, "status": "error"}
-        )
+        logger.exception("Error in read_file_content")
+        return {"error": str(e), "file_path": file_path, "status": "error"}
 
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "read_file_content",
-            "description": "Reads and returns the content of a specified text file. "
-            "File paths are relative to the current working directory or focus directory if one is set.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "The relative path to the file to be read. "
-                        "e.g., 'document.txt' or 'folder/data.csv'",
-                    },
-                    "use_focus_path": {
-                        "type": "boolean",
-                        "description": "Whether to use the focus path as the base directory. "
-                        "If true (default), paths are relative to the focus directory if one is set. "
-                        "If false, paths are always relative to the current working directory.",
-                        "default": True,
-                    }
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "read_file_content",
+        "description": "Reads and returns the content of a specified text file. "
+        "File paths are relative to the current working directory or focus directory if one is set.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file to be read. "
+                    "e.g., 'document.txt' or 'folder/data.csv'",
+                },
+                "use_focus_path": {
+                    "type": "boolean",
+                    "description": "Whether to use the focus path as the base directory. "
+                    "If true (default), paths are relative to the focus directory if one is set. "
+                    "If false, paths are always relative to the current working directory.",
+                    "default": True,
                 },
-                "required": ["file_path"],
+                "offset": {
+                    "type": "integer",
+                    "description": "Byte offset to start reading from. Use with 'length' to read "
+                    "large files in pieces. Defaults to 0.",
+                    "default": 0,
+                },
+                "length": {
+                    "type": "integer",
+                    "description": "Maximum number of bytes to read from 'offset'. "
+                    "If omitted, the file is read to the end.",
+                }
             },
+            "required": ["file_path"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,10 +1,99 @@
+import concurrent.futures
 import fnmatch
-import json
+import logging
 import os
-import traceback
-from agent.tools.shared.gitignore_parser import parse_gitignore, is_ignored
+import re
+from agent.tools.shared.gitignore_parser import parse_gitignore
+from agent.tools.shared.json_utils import json_tool
+from agent.tools.shared.path_utils import is_pending_deletion, is_within_dir
 
+logger = logging.getLogger(__name__)
 
+
+# Directories listed concurrently; readdir latency dominates on slow or
+# networked filesystems, so several listings are kept in flight
+_SCAN_WORKERS = 8
+
+
+def _scan_dir(dirpath, rel_dir, prefix, patterns):
+    """
+    Lists one directory for _scan_files.
+
+    Args:
+        dirpath (str): Directory to list
+        rel_dir (str): Its path relative to the directory the patterns apply to
+        prefix (str): Its '/'-terminated path relative to the search root
+        patterns (CompiledPatterns or None): Patterns as returned by parse_gitignore
+
+    Returns:
+        tuple: (files, subdirs) where files are (DirEntry, relative path)
+        pairs and subdirs are argument tuples for further _scan_dir calls
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                # Skip trees delete_directory is still removing
+                if is_pending_deletion(entry.name):
+                    continue
+                if patterns is not None and patterns.is_ignored_entry(entry, rel_dir):
+                    continue
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append((
+                            entry.path,
+                            os.path.join(rel_dir, entry.name),
+                            prefix + entry.name + "/",
+                        ))
+                else:
+                    files.append((entry, prefix + entry.name))
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _scan_files(top, patterns=None, base_dir=None):
+    """
+    Walks a directory tree with os.scandir, yielding the files in it.
+
+    Directories are listed by a pool of worker threads, each listing one
+    directory and handing its subdirectories back to be queued, so several
+    readdir calls are in flight at once. When patterns are given, ignored
+    entries are dropped before ignored directories are descended into. As
+    with os.walk, symlinks to directories are not followed and unreadable
+    directories are skipped. Files are yielded in no particular order.
+
+    Args:
+        top (str): Directory to start walking from
+        patterns (CompiledPatterns, optional): Patterns as returned by parse_gitignore
+        base_dir (str, optional): Directory the patterns are relative to
+
+    Yields:
+        tuple: (DirEntry, path of the entry relative to top, with '/' separators)
+    """
+    rel_base = os.path.relpath(top, base_dir) if base_dir is not None else ""
+    if rel_base == os.curdir:
+        rel_base = ""
+
+    # Directories waiting to be listed; only a bounded number are submitted
+    # at a time so a wide tree does not queue every directory as a task
+    pending = [(top, rel_base, "")]
+    running = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        while pending or running:
+            while pending and len(running) < 2 * _SCAN_WORKERS:
+                running.add(pool.submit(_scan_dir, *pending.pop(), patterns))
+            done, running = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                files, subdirs = future.result()
+                pending.extend(subdirs)
+                yield from files
+
+
+@json_tool
 def search_files(search_path: str = ".", file_pattern: str = "*", respect_gitignore: bool = True):
     """
     Searches for files matching a pattern within a directory and its subdirectories.
@@ -15,135 +104,117 @@ def search_files(search_path: str = ".", file_pattern: str = "*", respect_gitign
     Returns:
         str: A JSON string with a list of found files or an error message.
     """
-    print(
-        f"--- TOOL EXECUTING: search_files(search_path='{search_path}', file_pattern='{file_pattern}', respect_gitignore={respect_gitignore}) ---"
+    logger.debug(
+        "search_files(search_path=%r, file_pattern=%r, respect_gitignore=%s)",
+        search_path, file_pattern, respect_gitignore,
     )
     try:
         if not isinstance(search_path, str):
-            return json.dumps(
-                {
-                    "error": "Invalid search_path type, must be a string.",
-                    "path_received": str(search_path),
-                    "status": "error",
-                }
-            )
+            return {
+                "error": "Invalid search_path type, must be a string.",
+                "path_received": str(search_path),
+                "status": "error",
+            }
         if not isinstance(file_pattern, str):
-            return json.dumps(
-                {
-                    "error": "Invalid file_pattern type, must be a string.",
-                    "pattern_received": str(file_pattern),
-                    "status": "error",
-                }
-            )
+            return {
+                "error": "Invalid file_pattern type, must be a string.",
+                "pattern_received": str(file_pattern),
+                "status": "error",
+            }
 
         base_dir = os.getcwd()
         resolved_search_path = os.path.abspath(
             os.path.join(base_dir, search_path)
         )
 
-        if not resolved_search_path.startswith(base_dir):
-            print(
-                f"Security Alert: Attempt to search in '{resolved_search_path}' outside of base directory '{base_dir}'."
+        if not is_within_dir(resolved_search_path, base_dir):
+            logger.warning(
+                "Security Alert: Attempt to search in '%s' outside of base directory '%s'.",
+                resolved_search_path, base_dir,
             )
-            return json.dumps(
-                {
-                    "error": "Access denied: Search path is outside the allowed directory.",
-                    "search_path": search_path,
-                    "status": "error",
-                })
+            return {
+                "error": "Access denied: Search path is outside the allowed directory.",
+                "search_path": search_path,
+                "status": "error",
+            }
 
         if not os.path.isdir(resolved_search_path):
-            return json.dumps(
-                {
-                    "error": "Search path is not a valid directory.",
-                    "search_path": resolved_search_path,
-                    "status": "error",
-                }
-            )
+            return {
+                "error": "Search path is not a valid directory.",
+                "search_path": resolved_search_path,
+                "status": "error",
+            }
 
         found_files = []
-        gitignore_patterns = []
+        gitignore_patterns = None
         if respect_gitignore:
+            # Ignored directories are pruned before the walk descends into them
             gitignore_patterns = parse_gitignore(base_dir)
 
-        for root, dirs, files in os.walk(resolved_search_path):
-            # Filter out ignored directories first
-            if respect_gitignore:
-                 dirs[:] = [d for d in dirs if not is_ignored(os.path.join(root, d), gitignore_patterns)]
-
-            for filename in files:
-                full_path = os.path.join(root, filename)
-                # Convert to relative path for gitignore check
-                relative_path = os.path.relpath(full_path, base_dir)
-
-                if respect_gitignore and is_ignored(relative_path, gitignore_patterns):
-                    continue
+        # Compile the pattern once instead of going through fnmatch's cache
+        # for every file; names are case-normalized as fnmatch.fnmatch does
+        match_name = re.compile(fnmatch.translate(os.path.normcase(file_pattern))).match
+        normcase = os.path.normcase
 
-                if fnmatch.fnmatch(filename, file_pattern):
-                    relative_file_path_from_search = os.path.relpath(
-                        full_path, resolved_search_path
-                    )
-                    found_files.append(
-                        os.path.join(search_path, relative_file_path_from_search).replace(
-                            "\\", "/"
-                        )
-                    )
+        # Results are search_path joined with each file's path below it
+        result_prefix = os.path.join(search_path, "").replace("\\", "/")
+        for entry, relative_path in _scan_files(resolved_search_path, gitignore_patterns, base_dir):
+            if match_name(normcase(entry.name)) is not None:
+                found_files.append(result_prefix + relative_path)
+        # Directories are listed concurrently, so sort for a stable result
+        found_files.sort()
 
         if not found_files:
-            return json.dumps(
-                {
-                    "search_path": search_path,
-                    "file_pattern": file_pattern,
-                    "found_files": [],
-                    "message": "No files found matching the pattern.",
-                }
-            )
-
-        return json.dumps(
-            {
+            return {
                 "search_path": search_path,
                 "file_pattern": file_pattern,
-                "found_files": found_files,
-                "status": "success",
+                "found_files": [],
+                "message": "No files found matching the pattern.",
             }
-        )
+
+        return {
+            "search_path": search_path,
+            "file_pattern": file_pattern,
+            "found_files": found_files,
+            "status": "success",
+        }
 
     except Exception as e:
-        print(f"Error in search_files: {e}")
-        traceback.print_exc()
-        return json.dumps(
-            {
-                "error": str(e),
-                "search_path": search_path,
-                "file_pattern": file_pattern,
-                "status": "error",
-            }
-        )
+        logger.exception("Error in search_files")
+        return {
+            "error": str(e),
+            "search_path": search_path,
+            "file_pattern": file_pattern,
+            "status": "error",
+        }
 
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "search_files",
-            "description": "Searches for files matching a specific pattern within a given directory and its subdirectories. Paths are relative to the current working directory.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "search_path": {
-                        "type": "string",
-                        "description": "The directory path to start the search from. Defaults to the current working directory ('.') if not specified.",
-                    },
-                    "file_pattern": {
-                        "type": "string",
-                        "description": "The file pattern to search for (e.g., '*.txt', 'report_*.docx', '*'). Defaults to '*' (all files) if not specified.",
-                    },
-                    "respect_gitignore": {
-                         "type": "boolean",
-                         "description": "Whether to respect .gitignore patterns and filter out ignored files and directories. If true (default), ignores files matching patterns in .gitignore. If false, lists all files in the directory.",
-                    },
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "search_files",
+        "description": "Searches for files matching a specific pattern within a given directory and its subdirectories. Paths are relative to the current working directory.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "search_path": {
+                    "type": "string",
+                    "description": "The directory path to start the search from. Defaults to the current working directory ('.') if not specified.",
                 },
-                "required": [],
-            }
-        },
-    }
+                "file_pattern": {
+                    "type": "string",
+                    "description": "The file pattern to search for (e.g., '*.txt', 'report_*.docx', '*'). Defaults to '*' (all files) if not specified.",
+                },
+                "respect_gitignore": {
+                     "type": "boolean",
+                     "description": "Whether to respect .gitignore patterns and filter out ignored files and directories. If true (default), ignores files matching patterns in .gitignore. If false, lists all files in the directory.",
+                },
+            },
+            "required": [],
+        }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
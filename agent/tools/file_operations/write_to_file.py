@@ -1,123 +1,472 @@
-import json
+import logging
 import os
-import traceback
+import stat
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from agent.tools.shared.path_utils import resolve_path
+from agent.tools.shared.json_utils import json_tool
 
+logger = logging.getLogger(__name__)
 
-def write_to_file(file_path: str, content: str, use_focus_path: bool = True):
+# Content is encoded and written in slices of this many characters
+_WRITE_CHUNK_SIZE = 1 << 20
+
+# Upper bound on files written at the same time by write_many
+_WRITE_WORKERS = 8
+
+# Most buffers a single writev() call accepts
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+# O_TMPFILE creates an unnamed file that is linked into place once written.
+# Linking it needs linkat(AT_SYMLINK_FOLLOW) on its /proc/self/fd entry;
+# os.link() only passes that flag together with a dir_fd, so libc's linkat
+# is called directly
+_O_TMPFILE = getattr(os, "O_TMPFILE", None)
+_AT_FDCWD = -100
+_AT_SYMLINK_FOLLOW = 0x400
+
+
+def _load_linkat():
+    if _O_TMPFILE is None or not os.path.isdir("/proc/self/fd"):
+        return None
+    try:
+        import ctypes
+
+        linkat = ctypes.CDLL(None, use_errno=True).linkat
+    except (ImportError, OSError, AttributeError):
+        return None
+    linkat.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+    linkat.restype = ctypes.c_int
+    return linkat
+
+
+_linkat = _load_linkat()
+
+
+def _write_all(fd, data):
+    """Writes all of data to a raw file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_str(fd, content):
+    """Encodes content slice by slice and writes each slice to a raw fd."""
+    for start in range(0, len(content), _WRITE_CHUNK_SIZE):
+        _write_all(fd, content[start:start + _WRITE_CHUNK_SIZE].encode("utf-8"))
+
+
+def _create_temp(parent, name):
     """
-    Writes the given content to a specified file, optionally using the focus path.
-    If the file exists, it will be overwritten. If it doesn't exist, it will be created.
-    
+    Creates a uniquely named temporary file next to the file it will replace.
+
+    The file is created with mode 0666 so that the kernel applies the
+    process's current umask, as open() does for a new file.
+
+    Args:
+        parent (str): Directory to create the file in
+        name (str): Name of the file being replaced
+
+    Returns:
+        tuple: (fd open for writing, path of the temporary file)
+    """
+    while True:
+        tmp_path = os.path.join(parent, f".{name}.{uuid.uuid4().hex[:12]}.tmp")
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _write_atomic(path, write):
+    """
+    Replaces a file so that readers see either the old or the new content.
+
+    The content is written to an unnamed O_TMPFILE file when the target does
+    not exist yet, and linked into place with a single linkat(). Otherwise,
+    or where O_TMPFILE is unavailable, it goes to a temporary file in the
+    same directory that is renamed over the target. Nothing is fsync()ed.
+
+    Args:
+        path (str): File to create or replace; a symlink is followed
+        write (callable): Called with a raw fd open for writing
+    """
+    path = os.path.realpath(path)
+    # A replaced file keeps its permission bits; a new one is created with
+    # 0666 and the kernel applies the current umask
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    parent = os.path.dirname(path)
+
+    if _linkat is not None and mode is None:
+        try:
+            fd = os.open(parent, _O_TMPFILE | os.O_WRONLY, 0o666)
+        except OSError:
+            # The filesystem does not support O_TMPFILE
+            fd = None
+        if fd is not None:
+            try:
+                write(fd)
+                if _linkat(_AT_FDCWD, f"/proc/self/fd/{fd}".encode(), _AT_FDCWD,
+                           os.fsencode(path), _AT_SYMLINK_FOLLOW) == 0:
+                    return
+                # EEXIST if the file was created meanwhile; either way the
+                # rename path below replaces whatever is there
+            finally:
+                os.close(fd)
+
+    fd, tmp_path = _create_temp(parent, os.path.basename(path))
+    try:
+        try:
+            write(fd)
+        finally:
+            os.close(fd)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _writev_all(fd, buffers):
+    """
+    Writes a sequence of buffers to a raw file descriptor with gathered writes.
+
+    Each writev() call takes up to _IOV_MAX buffers; after a short write the
+    partly written buffer is resumed from where the kernel stopped.
+
+    Args:
+        fd (int): File descriptor open for writing
+        buffers (list): bytes-like objects, written in order
+    """
+    views = [memoryview(b) for b in buffers if len(b)]
+    while views:
+        written = os.writev(fd, views[:_IOV_MAX])
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if written:
+            views[0] = views[0][written:]
+
+
+def _has_parts(path, parts):
+    """
+    Checks whether a file already holds exactly the concatenation of parts.
+
+    Args:
+        path (str): Path to the file
+        parts (list): Encoded content parts about to be written
+
+    Returns:
+        bool: True if writing parts would leave the file unchanged
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode) or st.st_size != sum(len(part) for part in parts):
+        return False
+
+    with open(path, "rb") as f:
+        for part in parts:
+            if f.read(len(part)) != part:
+                return False
+        return True
+
+
+def _has_content(path, content):
+    """
+    Checks whether a file already holds exactly the given content.
+
+    The file is compared slice by slice against the UTF-8 encoding of the
+    content and the comparison stops at the first difference.
+
+    Args:
+        path (str): Path to the file
+        content (str): Content about to be written
+
+    Returns:
+        bool: True if writing content would leave the file unchanged
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    # UTF-8 takes 1 to 4 bytes per character; outside that range the sizes
+    # cannot match and nothing needs to be read
+    if not stat.S_ISREG(st.st_mode) or not len(content) <= st.st_size <= 4 * len(content):
+        return False
+
+    with open(path, "rb") as f:
+        for start in range(0, len(content), _WRITE_CHUNK_SIZE):
+            data = content[start:start + _WRITE_CHUNK_SIZE].encode("utf-8")
+            if f.read(len(data)) != data:
+                return False
+        return not f.read(1)
+
+
+def _content_length(content):
+    """Returns the number of characters in str or list-of-str content."""
+    if isinstance(content, list):
+        return sum(len(part) for part in content if isinstance(part, str))
+    return len(content) if isinstance(content, str) else 0
+
+
+def _write_one(file_path, content, use_focus_path):
+    """
+    Writes one file and describes the outcome.
+
     Args:
         file_path (str): The path to the file to write (relative to base directory).
-        content (str): The content to write to the file.
+        content (str or list): The content to write to the file, either as one
+            string or as a list of strings written back to back.
         use_focus_path (bool): Whether to use the focus path as base directory.
-        
+
     Returns:
-        str: A JSON string indicating success or an error message.
+        dict: The result for this file, with a "status" key
     """
-    print(
-        f"--- TOOL EXECUTING: write_to_file(file_path='{file_path}', content_length={len(content)}, use_focus_path={use_focus_path}) ---"
-    )
     try:
         if not isinstance(file_path, str):
-            return json.dumps(
-                {
-                    "error": "Invalid file_path type, must be a string.",
-                    "path_received": str(file_path),
-                    "status": "error",
-                }
-            )
-        if not isinstance(content, str):
-            return json.dumps(
-                {
-                    "error": "Invalid content type, must be a string.",
+            return {
+                "error": "Invalid file_path type, must be a string.",
+                "path_received": str(file_path),
+                "status": "error",
+            }
+        if isinstance(content, list):
+            if not all(isinstance(part, str) for part in content):
+                return {
+                    "error": "Invalid content type, list items must be strings.",
                     "file_path": file_path,
                     "status": "error",
                 }
-            )
+            # Each part is encoded once and the encoded parts are handed to
+            # writev() as they are, without joining them into one buffer
+            parts = [part.encode("utf-8") for part in content]
+        elif isinstance(content, str):
+            parts = None
+        else:
+            return {
+                "error": "Invalid content type, must be a string or a list of strings.",
+                "file_path": file_path,
+                "status": "error",
+            }
 
         # Resolve the path using the shared utility
         resolved_path, base_dir, is_in_base_dir = resolve_path(file_path, use_focus_path)
 
         if not is_in_base_dir:
-            print(
-                f"Security Alert: Attempt to write file '{resolved_path}' outside of base directory '{base_dir}'."
+            logger.warning(
+                "Security Alert: Attempt to write file '%s' outside of base directory '%s'.",
+                resolved_path, base_dir,
             )
-            return json.dumps(
-                {
-                    "error": "Access denied: File path is outside the allowed directory.",
-                    "file_path": file_path,
-                    "base_directory": base_dir,
-                    "status": "error",
-                })
+            return {
+                "error": "Access denied: File path is outside the allowed directory.",
+                "file_path": file_path,
+                "base_directory": base_dir,
+                "status": "error",
+            }
 
         parent_dir = os.path.dirname(resolved_path)
-        if parent_dir and not os.path.exists(parent_dir):
+        if parent_dir:
+            # exist_ok lets makedirs skip existing directories itself, so
+            # there is no separate exists() check to race against; a parent
+            # that exists as a file still raises
             try:
-                os.makedirs(parent_dir)
-                print(f"Created parent directory: {parent_dir}")
-            except Exception as e_mkdir:
-                print(
-                    f"Error creating parent directory {parent_dir}: {e_mkdir}"
-                )
-                return json.dumps(
-                    {
-                        "error": f"Could not create parent directory: {str(e_mkdir)}",
-                        "file_path": file_path,
-                        "status": "error",
-                    })
-
-        with open(resolved_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        return json.dumps(
-            {
+                os.makedirs(parent_dir, exist_ok=True)
+            except OSError as e_mkdir:
+                logger.warning("Error creating parent directory %s: %s", parent_dir, e_mkdir)
+                return {
+                    "error": f"Could not create parent directory: {str(e_mkdir)}",
+                    "file_path": file_path,
+                    "status": "error",
+                }
+
+        # Rewriting identical content would only dirty pages and bump mtime
+        if _has_parts(resolved_path, parts) if parts is not None else _has_content(resolved_path, content):
+            return {
                 "file_path": file_path,
                 "resolved_path": resolved_path,
-                "status": "success",
-                "message": f"Content successfully written to {resolved_path}.",
+                "status": "unchanged",
+                "message": f"{resolved_path} already has this content; nothing was written.",
             }
-        )
+
+        # Each encoded slice goes straight to the kernel through a raw fd,
+        # skipping the copy into io's buffer; slicing bounds the size of
+        # each encoded buffer instead of encoding the whole content at once.
+        # The file is replaced atomically, so a failed write leaves the old
+        # content in place.
+        if parts is not None:
+            _write_atomic(resolved_path, lambda fd: _writev_all(fd, parts))
+        else:
+            _write_atomic(resolved_path, lambda fd: _write_str(fd, content))
+
+        return {
+            "file_path": file_path,
+            "resolved_path": resolved_path,
+            "status": "success",
+            "message": f"Content successfully written to {resolved_path}.",
+        }
 
     except Exception as e:
-        print(f"Error in write_to_file: {e}")
-        traceback.print_exc()
-        return json.dumps(
-            {"error": str(e), "file_path": file_path, "status": "error"}
+        logger.exception("Error in write_to_file")
+        return {"error": str(e), "file_path": file_path, "status": "error"}
+
+
+@json_tool
+def write_to_file(file_path: str, content, use_focus_path: bool = True):
+    """
+    Writes the given content to a specified file, optionally using the focus path.
+    If the file exists, it will be overwritten. If it doesn't exist, it will be created.
+    
+    Args:
+        file_path (str): The path to the file to write (relative to base directory).
+        content (str or list): The content to write to the file, either as one
+            string or as a list of strings written back to back.
+        use_focus_path (bool): Whether to use the focus path as base directory.
+        
+    Returns:
+        str: A JSON string indicating success or an error message.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "write_to_file(file_path=%r, content_length=%s, use_focus_path=%s)",
+            file_path, _content_length(content), use_focus_path,
         )
+    return _write_one(file_path, content, use_focus_path)
 
 
-def get_tool_definition():
+@json_tool
+def write_many(files: list, use_focus_path: bool = True):
+    """
+    Writes several files in one call.
+
+    The files are written concurrently, so their open/write/close round
+    trips overlap instead of queueing behind each other. Each file is checked
+    and written exactly as write_to_file would, and a failure on one file
+    does not stop the others.
+
+    Args:
+        files (list): Items of the form {"file_path": ..., "content": ...}
+            or [file_path, content] pairs.
+        use_focus_path (bool): Whether to use the focus path as base directory.
+
+    Returns:
+        str: A JSON string with one result per file, in input order.
+    """
+    logger.debug(
+        "write_many(files=%s, use_focus_path=%s)",
+        len(files) if isinstance(files, list) else repr(files), use_focus_path,
+    )
+    if not isinstance(files, list):
+        return {"error": "Invalid files type, must be a list.", "status": "error"}
+
+    jobs = []
+    for item in files:
+        if isinstance(item, dict):
+            jobs.append((item.get("file_path"), item.get("content")))
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            jobs.append(tuple(item))
+        else:
+            jobs.append((item, None))
+
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(jobs), _WRITE_WORKERS)) as pool:
+            results = list(pool.map(lambda job: _write_one(*job, use_focus_path), jobs))
+    else:
+        results = [_write_one(*job, use_focus_path) for job in jobs]
+
+    counts = {"success": 0, "unchanged": 0, "error": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
     return {
-        "type": "function",
-        "function": {
-            "name": "write_to_file",
-            "description": "Writes the given string content to a specified file. If the file exists, it will be overwritten. If it does not exist, it will be created. File paths are relative to the current working directory or focus directory if one is set.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "The relative path to the file where content will be written. e.g., 'output.txt' or 'folder/notes.md'",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "The text content to write into the file.",
+        "results": results,
+        "total": len(results),
+        "success": counts["success"],
+        "unchanged": counts["unchanged"],
+        "errors": counts["error"],
+    }
+
+
+_TOOL_DEFINITION = [{
+    "type": "function",
+    "function": {
+        "name": "write_to_file",
+        "description": "Writes the given string content to a specified file. If the file exists, it will be overwritten. If it does not exist, it will be created. File paths are relative to the current working directory or focus directory if one is set.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file where content will be written. e.g., 'output.txt' or 'folder/notes.md'",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "The text content to write into the file.",
+                },
+                "use_focus_path": {
+                    "type": "boolean",
+                    "description": "Whether to use the focus path as the base directory. "
+                    "If true (default), paths are relative to the focus directory if one is set. "
+                    "If false, paths are always relative to the current working directory.",
+                    "default": True,
+                }
+            },
+            "required": [
+                "file_path",
+                "content"],
+        },
+    },
+}, {
+    "type": "function",
+    "function": {
+        "name": "write_many",
+        "description": "Writes several files in one call, e.g. for an edit that touches multiple files. Each file is created or overwritten as with write_to_file, and the result lists the outcome for every file. File paths are relative to the current working directory or focus directory if one is set.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "files": {
+                    "type": "array",
+                    "description": "The files to write.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file_path": {
+                                "type": "string",
+                                "description": "The relative path to the file where content will be written.",
+                            },
+                            "content": {
+                                "type": "string",
+                                "description": "The text content to write into the file.",
+                            },
+                        },
+                        "required": ["file_path", "content"],
                     },
-                    "use_focus_path": {
-                        "type": "boolean",
-                        "description": "Whether to use the focus path as the base directory. "
-                        "If true (default), paths are relative to the focus directory if one is set. "
-                        "If false, paths are always relative to the current working directory.",
-                        "default": True,
-                    }
                 },
-                "required": [
-                    "file_path",
-                    "content"],
+                "use_focus_path": {
+                    "type": "boolean",
+                    "description": "Whether to use the focus path as the base directory. "
+                    "If true (default), paths are relative to the focus directory if one is set. "
+                    "If false, paths are always relative to the current working directory.",
+                    "default": True,
+                }
             },
+            "required": ["files"],
         },
-    }
+    },
+}]
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
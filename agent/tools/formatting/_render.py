@@ -0,0 +1,89 @@
+"""
+Shared rendering state for the formatting tools.
+
+Building a rich Console, loading a Pygments style and looking up a lexer
+each cost more than highlighting a short snippet. This module creates them
+once per process and hands the same instances to every call.
+"""
+import functools
+import io
+import threading
+
+from rich.console import Console
+from rich.syntax import Syntax
+
+# Console used to render to ANSI strings; its file is swapped per call
+_ANSI_CONSOLE = Console(file=io.StringIO(), force_terminal=True, highlight=True, width=100)
+_ANSI_LOCK = threading.Lock()
+
+# Recording console that prints to the terminal; export_text() clears its
+# record after each call
+_RECORD_CONSOLE = Console(record=True, width=100)
+_RECORD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def get_lexer(language):
+    """
+    Get a Pygments lexer for a language name, built once per name.
+
+    Args:
+        language (str): Language name or alias, e.g. 'python'
+
+    Returns:
+        Lexer or str: The lexer, or the name itself if Pygments does not know
+        it (Syntax then renders the content as plain text)
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        return language
+
+
+@functools.lru_cache(maxsize=8)
+def get_theme(name="monokai"):
+    """
+    Get a Syntax theme, loading the Pygments style once per name.
+
+    Args:
+        name (str): Pygments style name
+
+    Returns:
+        SyntaxTheme: Theme to pass as Syntax(theme=...)
+    """
+    return Syntax.get_theme(name)
+
+
+def render_ansi(renderable):
+    """
+    Render a rich renderable to a string with ANSI escape sequences.
+
+    Args:
+        renderable: Anything rich can print
+
+    Returns:
+        str: The rendered output
+    """
+    with _ANSI_LOCK:
+        buffer = io.StringIO()
+        _ANSI_CONSOLE.file = buffer
+        _ANSI_CONSOLE.print(renderable)
+        return buffer.getvalue()
+
+
+def print_and_export_text(renderable):
+    """
+    Print a rich renderable to the terminal and return it as plain text.
+
+    Args:
+        renderable: Anything rich can print
+
+    Returns:
+        str: The printed output without styles
+    """
+    with _RECORD_LOCK:
+        _RECORD_CONSOLE.print(renderable)
+        return _RECORD_CONSOLE.export_text()
@@ -1,46 +1,50 @@
 import json
 
-from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.syntax import Syntax
 
+from agent.tools.formatting._render import get_lexer, get_theme, render_ansi
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "rich_output",
-            "description": "Format text for rich terminal display with syntax highlighting",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "The text content to format",
-                    },
-                    "format_type": {
-                        "type": "string",
-                        "description": "The format type: 'code', 'markdown', 'panel', "
-                                       "or 'syntax'",
-                        "enum": ["code", "markdown", "panel", "syntax"],
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": "Programming language for syntax highlighting "
-                                       "(python, javascript, etc.)",
-                        "default": "python",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Optional title for panels",
-                        "default": "",
-                    },
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "rich_output",
+        "description": "Format text for rich terminal display with syntax highlighting",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "The text content to format",
+                },
+                "format_type": {
+                    "type": "string",
+                    "description": "The format type: 'code', 'markdown', 'panel', "
+                                   "or 'syntax'",
+                    "enum": ["code", "markdown", "panel", "syntax"],
+                },
+                "language": {
+                    "type": "string",
+                    "description": "Programming language for syntax highlighting "
+                                   "(python, javascript, etc.)",
+                    "default": "python",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Optional title for panels",
+                    "default": "",
                 },
-                "required": ["content", "format_type"],
             },
+            "required": ["content", "format_type"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
 
 
 def rich_output(content, format_type, language="python", title=""):
@@ -56,31 +60,24 @@ def rich_output(content, format_type, language="python", title=""):
     Returns:
         str: JSON string with formatted content (with ANSI escape sequences)
     """
-    console = Console(highlight=True, record=True)
-
     try:
-        # Create a string buffer by recording console output
-        with console.capture() as capture:
-            if format_type == "code" or format_type == "syntax":
-                syntax = Syntax(
-                    content, language, line_numbers=True, theme="monokai"
-                )
-                console.print(syntax)
-            elif format_type == "markdown":
-                md = Markdown(content)
-                console.print(md)
-            elif format_type == "panel":
-                panel = Panel(
-                    content,
-                    title=title,
-                    border_style="bright_blue"
-                )
-                console.print(panel)
-            else:
-                console.print(content)
+        if format_type == "code" or format_type == "syntax":
+            renderable = Syntax(
+                content, get_lexer(language), line_numbers=True, theme=get_theme("monokai")
+            )
+        elif format_type == "markdown":
+            renderable = Markdown(content)
+        elif format_type == "panel":
+            renderable = Panel(
+                content,
+                title=title,
+                border_style="bright_blue"
+            )
+        else:
+            renderable = content
 
-        # Get the captured output with ANSI codes
-        output = capture.get()
+        # Render with the shared console; the output keeps its ANSI codes
+        output = render_ansi(renderable)
 
         return json.dumps({"formatted_output": output})
 
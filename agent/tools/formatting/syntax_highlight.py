@@ -1,33 +1,71 @@
+import functools
 import json
 import os
+import stat
 
-from rich.console import Console
 from rich.syntax import Syntax
 
-
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "syntax_highlight",
-            "description": "Highlight syntax of a file based on its extension",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the file to highlight",
-                    },
-                    "line_numbers": {
-                        "type": "boolean",
-                        "description": "Whether to show line numbers",
-                        "default": True,
-                    },
+from agent.tools.formatting._render import get_lexer, get_theme, print_and_export_text
+
+# Map file extensions to languages
+_EXTENSION_MAP = {
+    ".py": "python",
+    ".js": "javascript",
+    ".html": "html",
+    ".css": "css",
+    ".json": "json",
+    ".md": "markdown",
+    ".txt": "text",
+    ".sh": "bash",
+    ".java": "java",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".ts": "typescript",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".xml": "xml",
+    ".sql": "sql",
+    ".toml": "toml",
+    ".ini": "ini",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _lang_for(file_path):
+    """Returns the highlighting language for a path, from its extension."""
+    return _EXTENSION_MAP.get(os.path.splitext(file_path)[1].lower(), "text")
+
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "syntax_highlight",
+        "description": "Highlight syntax of a file based on its extension",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to highlight",
+                },
+                "line_numbers": {
+                    "type": "boolean",
+                    "description": "Whether to show line numbers",
+                    "default": True,
                 },
-                "required": ["file_path"],
             },
+            "required": ["file_path"],
         },
-    }
+    },
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
 
 
 def syntax_highlight(file_path, line_numbers=True):
@@ -42,62 +80,48 @@ def syntax_highlight(file_path, line_numbers=True):
         str: JSON string containing the highlighted content or error message
     """
     try:
-        # Verify file exists
-        if not os.path.isfile(file_path):
+        # Verify file exists; the same stat() gives the size to read
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             return json.dumps({"error": f"File '{file_path}' not found"})
 
-        # Read the file content
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Read the file content with os.read() sized to the stat, bypassing
+        # the buffered text layer; the loop only repeats if the file grew
+        # or the kernel returned less than asked
+        chunks = []
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = st.st_size + 1
+            while True:
+                chunk = os.read(fd, size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        content = b"".join(chunks).decode("utf-8")
+        # Text mode used to translate line endings; keep doing that
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
 
         # Determine the lexer based on file extension
-        file_extension = os.path.splitext(file_path)[1].lower()
-
-        # Map file extensions to languages
-        extension_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".html": "html",
-            ".css": "css",
-            ".json": "json",
-            ".md": "markdown",
-            ".txt": "text",
-            ".sh": "bash",
-            ".java": "java",
-            ".cpp": "cpp",
-            ".c": "c",
-            ".go": "go",
-            ".rs": "rust",
-            ".rb": "ruby",
-            ".php": "php",
-            ".ts": "typescript",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".xml": "xml",
-            ".sql": "sql",
-            ".toml": "toml",
-            ".ini": "ini",
-        }
-
-        language = extension_map.get(file_extension, "text")
-
-        # Create a console to capture the output
-        console = Console(record=True, width=100)
-
-        # Create a syntax object with the content and language
+        language = _lang_for(file_path)
+
+        # Create a syntax object with the content and a cached lexer/theme
         syntax = Syntax(
             content,
-            language,
+            get_lexer(language),
             line_numbers=line_numbers,
-            theme="monokai",
+            theme=get_theme("monokai"),
             word_wrap=True,
         )
 
-        # Print the syntax object to the console
-        console.print(syntax)
-
-        # Get the string representation with ANSI codes
-        output = console.export_text()
+        # Print the syntax object to the console and get the string
+        # representation of what was printed
+        output = print_and_export_text(syntax)
 
         return json.dumps({"formatted_output": output, "language": language})
 
@@ -0,0 +1,41 @@
+"""
+Subprocess helper shared by the git tools.
+
+Each tool used to build its own subprocess.run() call, which looked git up
+on PATH every time and, with check=True, turned ordinary non-zero exits
+into exceptions. run_git() resolves git once, decodes the output once and
+leaves the exit status for the caller to branch on. The environment is
+inherited at spawn time, so variables set after startup (GIT_DIR,
+credentials) reach git.
+"""
+import shutil
+import subprocess
+
+# Absolute path to git, resolved once; falls back to a PATH lookup per call
+_GIT = shutil.which("git") or "git"
+
+
+def run_git(args, cwd=None):
+    """
+    Run a git command and capture its output.
+
+    Args:
+        args (list): Arguments after 'git', e.g. ['branch', 'feature']
+        cwd (str): Directory to run in (default: current directory)
+
+    Returns:
+        subprocess.CompletedProcess: The finished process with stdout and
+        stderr as str; a non-zero returncode is not raised as an exception
+    """
+    # Output is captured as bytes and decoded in one go, rather than
+    # through text-mode wrappers around the pipes
+    result = subprocess.run(
+        [_GIT, *args],
+        capture_output=True,
+        check=False,
+        cwd=cwd,
+        close_fds=False,
+    )
+    result.stdout = result.stdout.decode("utf-8", "replace")
+    result.stderr = result.stderr.decode("utf-8", "replace")
+    return result
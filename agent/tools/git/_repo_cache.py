@@ -0,0 +1,108 @@
+"""
+Repository cache for the git tools.
+
+Constructing a git.Repo spawns git subprocesses to locate and read the
+repository configuration, which dominates the cost of simple queries. This
+module keeps a small LRU of Repo instances keyed by absolute path and
+re-creates an instance when .git/HEAD or .git/index changes on disk. Cached
+instances also keep their persistent `git cat-file --batch` readers alive.
+"""
+import os
+from collections import OrderedDict
+
+from agent.tools.git._worktree import get_worktree_info, reset_worktree_info
+
+
+class _RepoCache:
+    """A small LRU cache of git.Repo instances validated by stat()."""
+
+    # Files whose mtime/size changes invalidate a cached Repo
+    WATCHED_FILES = ("HEAD", "index")
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # path -> (stamp, repo)
+
+    def _stamp(self, git_dir):
+        stamp = []
+        for name in self.WATCHED_FILES:
+            try:
+                st = os.stat(os.path.join(git_dir, name))
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def get(self, path):
+        entry = self._entries.get(path)
+        if entry is not None:
+            stamp, repo = entry
+            if stamp == self._stamp(repo.git_dir):
+                self._entries.move_to_end(path)
+                return repo
+            self._discard(path)
+
+        # Deferred so that loading the git tools does not import GitPython
+        import git
+
+        # GitCmdObjectDB serves object reads through one persistent
+        # `git cat-file --batch` process per Repo; keeping the Repo cached
+        # keeps that process alive across tool calls.
+        repo = git.Repo(path, odbt=git.GitCmdObjectDB)
+        self._entries[path] = (self._stamp(repo.git_dir), repo)
+        while len(self._entries) > self.maxsize:
+            self._discard(next(iter(self._entries)))
+        return repo
+
+    def _discard(self, path):
+        _, repo = self._entries.pop(path)
+        # Terminate any persistent cat-file processes held by the instance
+        repo.close()
+
+    def clear(self):
+        for path in list(self._entries):
+            self._discard(path)
+
+
+_cache = _RepoCache()
+
+
+def get_repo(path):
+    """
+    Get a shared git.Repo for the given path.
+
+    Args:
+        path (str): Absolute path to the repository working tree
+
+    Returns:
+        git.Repo: A cached Repo, re-created if HEAD or the index changed
+    """
+    return _cache.get(path)
+
+
+def get_current_repo():
+    """
+    Get the shared git.Repo for the working tree containing the current directory.
+
+    If the cached working tree no longer holds a repository (for example it
+    was deleted or re-initialised elsewhere), the worktree is detected again
+    and the lookup retried once.
+
+    Returns:
+        git.Repo: A cached Repo for the current working tree
+
+    Raises:
+        RuntimeError: If the current directory is not inside a git repository
+    """
+    import git
+
+    try:
+        return get_repo(get_worktree_info().root)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        reset_worktree_info()
+        return get_repo(get_worktree_info().root)
+
+
+def clear_repo_cache():
+    """Close and drop all cached Repo instances."""
+    _cache.clear()
@@ -0,0 +1,75 @@
+"""
+Working tree detection for the git tools.
+
+Locating the repository used to cost one `git rev-parse` per Repo lookup.
+This module asks git for the top level, common git directory and the path
+back to the top level in a single call and caches the answer for the
+current working directory.
+"""
+import functools
+import os
+from dataclasses import dataclass
+
+from agent.tools.git._common import run_git
+
+
+@dataclass(frozen=True)
+class WorktreeInfo:
+    """Location of the working tree containing the current directory."""
+
+    root: str             # Absolute path to the top of the working tree
+    git_common_dir: str   # Absolute path to the (possibly shared) git directory
+    cdup: str             # Relative path from the current directory to root
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_worktree(cwd):
+    result = run_git(
+        ["rev-parse", "--show-toplevel", "--git-common-dir", "--show-cdup"],
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            result.stderr.strip() or f"Not a git repository: {cwd}"
+        )
+
+    lines = result.stdout.split("\n")
+    root = os.path.normpath(lines[0])
+    # --git-common-dir may be reported relative to the current directory
+    git_common_dir = os.path.normpath(os.path.join(cwd, lines[1]))
+    cdup = lines[2] if len(lines) > 2 else ""
+    return WorktreeInfo(root=root, git_common_dir=git_common_dir, cdup=cdup)
+
+
+def get_worktree_info():
+    """
+    Get the working tree containing the current directory.
+
+    The result is cached per working directory, so a chdir invalidates it.
+
+    Returns:
+        WorktreeInfo: The root, common git directory and cdup of the worktree
+
+    Raises:
+        RuntimeError: If the current directory is not inside a git repository
+    """
+    return _detect_worktree(os.getcwd())
+
+
+def reset_worktree_info():
+    """Forget the cached working tree, e.g. after its .git was replaced."""
+    _detect_worktree.cache_clear()
+
+
+def to_root_relative(info, path):
+    """
+    Convert a path relative to the current directory to one relative to root.
+
+    Args:
+        info (WorktreeInfo): The working tree the path belongs to
+        path (str): Path relative to the current directory
+
+    Returns:
+        str: The equivalent path relative to the working tree root
+    """
+    return os.path.relpath(os.path.abspath(path), info.root)
@@ -1,8 +1,12 @@
-import json
-import os
-import traceback
-import subprocess
+import logging
 
+from agent.tools.git._common import run_git
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+
+@json_tool
 def list_branches():
     """
     Lists existing Git branches.
@@ -10,42 +14,42 @@ def list_branches():
     Returns:
         str: A JSON string containing the list of branches or an error message.
     """
-    print("--- TOOL EXECUTING: list_branches() ---")
+    logger.debug("list_branches()")
     try:
-        # Implement the actual git branch command execution to list branches
-        command = ['git', 'branch']
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        result = run_git(['branch'])
+        if result.returncode != 0:
+            return {
+                "error": result.stderr.strip() or f"git branch exited with status {result.returncode}",
+                "status": "error",
+            }
+
         branches = [branch.strip() for branch in result.stdout.strip().splitlines()]
 
-        return json.dumps({
+        return {
             "status": "success",
             "branches": branches
-        })
-
-        # Placeholder response
-        # placeholder_branches = ["main", "development", "feature/new-feature"]
-        # return json.dumps({
-        #     "status": "success",
-        #     "branches": placeholder_branches
-        # })
+        }
 
     except Exception as e:
-        print(f"Error in list_branches: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in list_branches")
+        return {
             "error": str(e),
             "status": "error",
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "list_branches",
-            "description": "Lists existing Git branches.",
-            "parameters": {
-                "type": "object",
-                "properties": {}
-            }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "list_branches",
+        "description": "Lists existing Git branches.",
+        "parameters": {
+            "type": "object",
+            "properties": {}
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,8 +1,34 @@
-import json
+import logging
 import os
-import traceback
-import git
 
+from agent.tools.git._repo_cache import get_current_repo
+from agent.tools.git._worktree import get_worktree_info, to_root_relative
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+
+def _is_tracked_path(repo, path):
+    """
+    Check whether a path is a tracked file or a directory containing tracked files.
+
+    Args:
+        repo (git.Repo): The repository to check against
+        path (str): Path relative to the working tree root
+
+    Returns:
+        bool: True if the index has an entry at or below the path
+    """
+    path = os.path.normpath(path).replace(os.sep, "/")
+    if path == ".":
+        return True
+    prefix = path + "/"
+    return any(
+        entry_path == path or entry_path.startswith(prefix)
+        for entry_path, _stage in repo.index.entries
+    )
+
+@json_tool
 def checkout(branch_or_path, force=False, create_new_branch=False):
     """
     Checks out a Git branch or restores working tree files using GitPython.
@@ -15,29 +41,63 @@ def checkout(branch_or_path, force=False, create_new_branch=False):
     Returns:
         str: A JSON string containing the checkout status and information or an error message.
     """
-    print(f"--- TOOL EXECUTING: checkout(branch_or_path={branch_or_path}, force={force}, create_new_branch={create_new_branch}) ---")
+    logger.debug(
+        "checkout(branch_or_path=%r, force=%s, create_new_branch=%s)",
+        branch_or_path, force, create_new_branch,
+    )
+    import git  # Deferred: GitPython is slow to import and only needed here
+
     try:
-        repo = git.Repo('.')
+        repo = get_current_repo()
+        worktree = get_worktree_info()
+        # Index paths are relative to the root, not the current directory
+        root_path = to_root_relative(worktree, branch_or_path)
 
         if create_new_branch:
             # Create and checkout a new branch
-            repo.git.checkout('-b', branch_or_path)
+            if branch_or_path in repo.heads:
+                return {
+                    "error": f"Error: Branch '{branch_or_path}' already exists.",
+                    "status": "error"
+                }
+            repo.create_head(branch_or_path).checkout(force=force)
             message = f"Successfully created and checked out new branch '{branch_or_path}'."
+        elif branch_or_path in repo.heads:
+            # Checkout an existing local branch
+            repo.heads[branch_or_path].checkout(force=force)
+            message = f"Successfully checked out '{branch_or_path}'."
+        elif _is_tracked_path(repo, root_path):
+            # Restore a tracked path from the index. Like
+            # `git checkout -- <path>`, this always discards working tree
+            # changes to the path, so force is implied here.
+            repo.index.checkout(paths=[root_path], force=True)
+            message = f"Successfully checked out '{branch_or_path}'."
         else:
-            # Checkout existing branch or path
+            # Tags, remote branches, commits: let git resolve the name
             options = [branch_or_path]
             if force:
                 options.insert(0, '-f')
             repo.git.checkout(*options)
             message = f"Successfully checked out '{branch_or_path}'."
 
-        return json.dumps({
+        return {
             "status": "success",
             "message": message
-        })
+        }
 
+    except git.CheckoutError as e:
+        logger.warning("Checkout error in checkout: %s", e)
+        if e.failed_files:
+            changes = f"Your local changes to {', '.join(e.failed_files)}"
+        else:
+            changes = "Your local changes"
+        return {
+            "error": f"Error: {changes} would be overwritten by checking out '{branch_or_path}'. Use the 'force' option to discard them.",
+            "status": "error",
+            "git_error": str(e)
+        }
     except git.GitCommandError as e:
-        print(f"Git command error in checkout: {e}")
+        logger.warning("Git command error in checkout: %s", e)
         # Attempt to parse the error message for more helpful output
         error_message = str(e)
         if "did not match any file(s) known to git" in error_message:
@@ -48,44 +108,47 @@ def checkout(branch_or_path, force=False, create_new_branch=False):
             user_message = f"Error executing git checkout: {error_message}"
 
 
-        return json.dumps({
+        return {
             "error": user_message,
             "status": "error",
             "git_error": error_message # Include raw git error for debugging
-        })
+        }
     except Exception as e:
-        print(f"Error in checkout: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in checkout")
+        return {
             "error": str(e),
             "status": "error"
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "checkout",
-            "description": "Checks out a Git branch or restores working tree files.",
-            "parameters": {
-                "type": "object",
-                "required": [
-                    "branch_or_path"
-                ],
-                "properties": {
-                    "branch_or_path": {
-                        "type": "string",
-                        "description": "The branch to checkout or the path to restore."
-                    },
-                    "force": {
-                        "type": "boolean",
-                        "description": "Whether to force the checkout (e.g., discard local changes)."
-                    },
-                     "create_new_branch": {
-                        "type": "boolean",
-                        "description": "Whether to create a new branch before checking out."
-                    }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "checkout",
+        "description": "Checks out a Git branch or restores working tree files.",
+        "parameters": {
+            "type": "object",
+            "required": [
+                "branch_or_path"
+            ],
+            "properties": {
+                "branch_or_path": {
+                    "type": "string",
+                    "description": "The branch to checkout or the path to restore."
+                },
+                "force": {
+                    "type": "boolean",
+                    "description": "Whether to force the checkout (e.g., discard local changes)."
+                },
+                 "create_new_branch": {
+                    "type": "boolean",
+                    "description": "Whether to create a new branch before checking out."
                 }
             }
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
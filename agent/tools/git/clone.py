@@ -1,6 +1,9 @@
 import json
+import logging
 import os
-import traceback
+
+logger = logging.getLogger(__name__)
+
 
 def clone(repo_url: str, dest_dir: str = None):
     """
@@ -13,7 +16,7 @@ def clone(repo_url: str, dest_dir: str = None):
     Returns:
         str: A JSON string indicating success or an error message.
     """
-    print(f"--- TOOL EXECUTING: clone(repo_url='{repo_url}', dest_dir='{dest_dir}') ---")
+    logger.debug("clone(repo_url=%r, dest_dir=%r)", repo_url, dest_dir)
     try:
         # TODO: Implement the actual git clone command execution
         # import subprocess
@@ -38,32 +41,35 @@ def clone(repo_url: str, dest_dir: str = None):
         })
 
     except Exception as e:
-        print(f"Error in clone: {e}")
-        traceback.print_exc()
+        logger.exception("Error in clone")
         return json.dumps({
             "error": str(e),
             "status": "error",
         })
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "clone",
-            "description": "Clones a Git repository.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "repo_url": {
-                        "type": "string",
-                        "description": "The URL of the repository to clone."
-                    },
-                    "dest_dir": {
-                        "type": "string",
-                        "description": "The local directory to clone into (default: current directory)."
-                    }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "clone",
+        "description": "Clones a Git repository.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "repo_url": {
+                    "type": "string",
+                    "description": "The URL of the repository to clone."
                 },
-                "required": ["repo_url"],
-            }
+                "dest_dir": {
+                    "type": "string",
+                    "description": "The local directory to clone into (default: current directory)."
+                }
+            },
+            "required": ["repo_url"],
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,7 +1,12 @@
-import json
-import os
-import traceback
+import logging
 
+from agent.tools.git._common import run_git
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+
+@json_tool
 def commit(message: str, all_changes: bool = False):
     """
     Commits changes to the Git repository.
@@ -13,56 +18,56 @@ def commit(message: str, all_changes: bool = False):
     Returns:
         str: A JSON string indicating success or an error message.
     """
-    print(f"--- TOOL EXECUTING: commit(message='{message}', all_changes='{all_changes}') ---")
+    logger.debug("commit(message=%r, all_changes=%s)", message, all_changes)
     try:
-        # TODO: Implement the actual git commit command execution
-        # import subprocess
-        # command = ['git', 'commit', '-m', message]
-        # if all_changes:
-        #     command.append('-a')
-        # result = subprocess.run(command, capture_output=True, text=True, check=True)
-        # return json.dumps({
-        #     "status": "success",
-        #     "message": result.stdout.strip(),
-        #     "error": result.stderr.strip(),
-        # })
+        command = ['commit', '-m', message]
+        if all_changes:
+            command.append('-a')
+        result = run_git(command)
 
-        # Placeholder response
-        action = "Committing all changes" if all_changes else "Committing staged changes"
-        message = f"{action} with message: '{message}'"
+        # "nothing to commit" is reported on stdout with a non-zero exit
+        if result.returncode != 0:
+            return {
+                "error": result.stderr.strip() or result.stdout.strip()
+                or f"git commit exited with status {result.returncode}",
+                "status": "error",
+            }
 
-        return json.dumps({
+        return {
             "status": "success",
-            "message": message,
-        })
+            "message": result.stdout.strip(),
+        }
 
     except Exception as e:
-        print(f"Error in commit: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in commit")
+        return {
             "error": str(e),
             "status": "error",
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "commit",
-            "description": "Commits changes to the Git repository.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "The commit message."
-                    },
-                    "all_changes": {
-                        "type": "boolean",
-                        "description": "Whether to automatically stage all modified and deleted files."
-                    }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "commit",
+        "description": "Commits changes to the Git repository.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "The commit message."
                 },
-                "required": ["message"],
-            }
+                "all_changes": {
+                    "type": "boolean",
+                    "description": "Whether to automatically stage all modified and deleted files."
+                }
+            },
+            "required": ["message"],
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,8 +1,12 @@
-import json
-import os
-import traceback
-import subprocess
+import logging
 
+from agent.tools.git._common import run_git
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+
+@json_tool
 def create_branch(branch_name: str):
     """
     Creates a new Git branch.
@@ -13,53 +17,57 @@ def create_branch(branch_name: str):
     Returns:
         str: A JSON string indicating success or failure.
     """
-    print(f"--- TOOL EXECUTING: create_branch(branch_name='{branch_name}') ---")
+    logger.debug("create_branch(branch_name=%r)", branch_name)
     try:
-        command = ['git', 'branch', branch_name]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # A failing git exit (e.g. the branch already exists) is an ordinary
+        # result here, not an exception
+        result = run_git(['branch', branch_name])
 
         if result.returncode == 0:
-            return json.dumps({
+            return {
                 "status": "success",
                 "message": f"Branch '{branch_name}' created successfully."
-            })
-        else:
-            return json.dumps({
-                "status": "error",
-                "message": result.stderr.strip()
-            })
+            }
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error creating branch '{branch_name}': {e}")
-        return json.dumps({
-            "error": str(e),
+        # An expected failure (e.g. the branch exists) that is returned to the
+        # caller below, so it is not logged as an error
+        logger.warning(
+            "Error creating branch '%s': git exited with status %s",
+            branch_name, result.returncode,
+        )
+        return {
+            "error": result.stderr.strip() or f"git branch exited with status {result.returncode}",
             "status": "error",
             "message": f"Failed to create branch '{branch_name}'. Git command failed."
-        })
+        }
+
     except Exception as e:
-        print(f"Error in create_branch: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in create_branch")
+        return {
             "error": str(e),
             "status": "error",
             "message": f"An unexpected error occurred while creating branch '{branch_name}'."
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "create_branch",
-            "description": "Creates a new Git branch.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "branch_name": {
-                        "type": "string",
-                        "description": "The name of the new branch."
-                    }
-                },
-                "required": ["branch_name"]
-            }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "create_branch",
+        "description": "Creates a new Git branch.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "branch_name": {
+                    "type": "string",
+                    "description": "The name of the new branch."
+                }
+            },
+            "required": ["branch_name"]
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
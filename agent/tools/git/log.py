@@ -1,79 +1,112 @@
-import json
-import os
-import traceback
-import git  # Import the git library
+import logging
 
+from agent.tools.git._common import run_git
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+# git date format matching the output of the previous GitPython implementation
+_DATE_FORMAT = "--date=format:%a %b %d %H:%M:%S %Y %z"
+
+# --pretty=format: strings for each supported 'pretty' option, up to the
+# summary line that ends every entry
+_FORMATS = {
+    "oneline": "%h ",
+    "short": "commit %H%nAuthor: %an <%ae>%n%n    ",
+    "medium": "commit %H%nAuthor: %an <%ae>%nDate:   %ad%n%n    ",
+    "full": "commit %H%nAuthor: %an <%ae>%nCommit: %cn <%ce>%nDate:   %ad%n%n    ",
+    "fuller": (
+        "commit %H%nAuthor: %an <%ae>%nAuthorDate: %ad%n"
+        "Commit: %cn <%ce>%nCommitDate: %cd%n%n    "
+    ),
+}
+
+# Terminates each entry, so multi-line entries can be split unambiguously
+_RECORD_SEPARATOR = "\x1e"
+
+# Separates the formatted header from the raw commit message
+_MESSAGE_SEPARATOR = "\x1f"
+
+
+@json_tool
 def log(max_count: int = 10, pretty: str = "oneline"):
     """
-    Retrieves the Git commit log using GitPython.
+    Retrieves the Git commit log with a single `git log` call.
 
     Args:
         max_count (int): The maximum number of log entries to return.
-        pretty (str): Format of the log. Note: GitPython's pretty format handling might differ slightly from the command line.
+        pretty (str): Format of the log: 'oneline', 'short', 'medium', 'full' or 'fuller'. Other values fall back to 'oneline'.
 
     Returns:
         str: A JSON string containing the log entries or an error message.
     """
-    print(f"--- TOOL EXECUTING: log(max_count='{max_count}', pretty='{pretty}') ---")
+    logger.debug("log(max_count=%r, pretty=%r)", max_count, pretty)
     try:
-        repo = git.Repo('.')  # Assumes the tool is run in the repository root
+        # git formats every entry itself, so the log costs one process
+        # regardless of how many commits are requested
+        log_format = _FORMATS.get(pretty, _FORMATS["oneline"])
+        # The raw message (%B) is requested instead of %s, which joins the
+        # whole first paragraph; the summary is its first line, as in
+        # GitPython's Commit.summary
+        result = run_git([
+            "log", "--no-color", "--abbrev=8", _DATE_FORMAT,
+            f"--max-count={int(max_count)}",
+            f"--pretty=format:{log_format}%x1f%B%x1e",
+        ])
+
+        if result.returncode != 0:
+            error_message = result.stderr.strip()
+            if "not a git repository" in error_message:
+                return {
+                    "error": "Not a git repository.",
+                    "status": "error",
+                }
+            return {
+                "error": error_message or f"git log exited with status {result.returncode}",
+                "status": "error",
+            }
 
-        # GitPython's log method directly returns commit objects
-        # We'll format them manually based on the 'pretty' option if supported,
-        # or just return commit information.
         log_entries = []
-        for commit in repo.iter_commits(max_count=max_count):
-            if pretty == "oneline":
-                log_entries.append(f"{commit.hexsha[:8]} {commit.summary}")
-            elif pretty == "short":
-                log_entries.append(f"commit {commit.hexsha}\nAuthor: {commit.author.name} <{commit.author.email}>\n\n    {commit.summary}")
-            elif pretty == "medium":
-                 log_entries.append(f"commit {commit.hexsha}\nAuthor: {commit.author.name} <{commit.author.email}>\nDate:   {commit.authored_datetime.strftime('%a %b %d %H:%M:%S %Y %z')}\n\n    {commit.summary}")
-            elif pretty == "full":
-                log_entries.append(f"commit {commit.hexsha}\nAuthor: {commit.author.name} <{commit.author.email}>\nCommit: {commit.committer.name} <{commit.committer.email}>\nDate:   {commit.authored_datetime.strftime('%a %b %d %H:%M:%S %Y %z')}\n\n    {commit.summary}")
-            elif pretty == "fuller":
-                log_entries.append(f"commit {commit.hexsha}\nAuthor: {commit.author.name} <{commit.author.email}>\nAuthorDate: {commit.authored_datetime.strftime('%a %b %d %H:%M:%S %Y %z')}\nCommit: {commit.committer.name} <{commit.committer.email}>\nCommitDate: {commit.committed_datetime.strftime('%a %b %d %H:%M:%S %Y %z')}\n\n    {commit.summary}")
-            else:
-                # Default to oneline or provide basic info for unsupported formats
-                log_entries.append(f"{commit.hexsha[:8]} {commit.summary}")
-
-
-        return json.dumps({
+        for entry in result.stdout.split(_RECORD_SEPARATOR):
+            if not entry.strip():
+                continue
+            header, _, message = entry.partition(_MESSAGE_SEPARATOR)
+            log_entries.append(header.lstrip("\n") + message.split("\n", 1)[0])
+
+        return {
             "status": "success",
             "log": log_entries,
-        })
+        }
 
-    except git.exc.InvalidGitRepositoryError:
-        return json.dumps({
-            "error": "Not a git repository.",
-            "status": "error",
-        })
     except Exception as e:
-        print(f"Error in log: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in log")
+        return {
             "error": str(e),
             "status": "error",
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "log",
-            "description": "Retrieves the Git commit log.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "max_count": {
-                        "type": "integer",
-                        "description": "The maximum number of log entries to return."
-                    },
-                    "pretty": {
-                        "type": "string",
-                        "description": "Format of the log. Can be 'oneline', 'short', 'medium', 'full', 'fuller', or a custom format string."
-                    }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "log",
+        "description": "Retrieves the Git commit log.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "max_count": {
+                    "type": "integer",
+                    "description": "The maximum number of log entries to return."
                 },
-            }
+                "pretty": {
+                    "type": "string",
+                    "description": "Format of the log. Can be 'oneline', 'short', 'medium', 'full' or 'fuller'."
+                }
+            },
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
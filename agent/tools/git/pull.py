@@ -1,8 +1,12 @@
-import json
-import os
-import traceback
-import git
+import logging
 
+from agent.tools.git._repo_cache import get_current_repo
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+
+@json_tool
 def pull(branch=None, remote='origin'):
     """
     Pulls changes from a remote Git repository using GitPython.
@@ -14,24 +18,24 @@ def pull(branch=None, remote='origin'):
     Returns:
         str: A JSON string containing the pull status and information or an error message.
     """
-    print(f"--- TOOL EXECUTING: pull(branch={branch}, remote={remote}) ---")
+    logger.debug("pull(branch=%r, remote=%r)", branch, remote)
     try:
-        repo = git.Repo('.')
+        repo = get_current_repo()
 
         # Get the remote
         try:
             origin = repo.remotes[remote]
         except IndexError:
-            return json.dumps({
+            return {
                 "status": "error",
                 "message": f"Error: Remote '{remote}' not found."
-            })
+            }
 
         # Pull changes
         if branch:
-            info = origin.pull(branch)
+            info = origin.pull(branch, progress=None)
         else:
-            info = origin.pull()
+            info = origin.pull(progress=None)
 
         # Prepare response data
         # The info object from pull() is a list of UpdateProgress objects
@@ -41,40 +45,45 @@ def pull(branch=None, remote='origin'):
 
         # You might want to add more detailed parsing of the info object
         # depending on what information you need to return.
-        pulled_branches = [str(i.ref) for i in info]
+        # Use the ref's name attribute rather than str(), which can go
+        # through GitPython's plumbing on some versions
+        pulled_branches = [i.ref.name if i.ref else i.remote_ref_path for i in info]
 
-        return json.dumps({
+        return {
             "status": "success",
             "message": f"Successfully pulled from {remote}.",
             "pulled_branches": pulled_branches
-        })
+        }
 
     except Exception as e:
-        print(f"Error in pull: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in pull")
+        return {
             "error": str(e),
             "status": "error"
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "pull",
-            "description": "Pulls changes from a remote Git repository.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "branch": {
-                        "type": "string",
-                        "description": "The name of the branch to pull (default: current branch)."
-                    },
-                    "remote": {
-                        "type": "string",
-                        "description": "The name of the remote repository (default: 'origin')."
-                    }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "pull",
+        "description": "Pulls changes from a remote Git repository.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "branch": {
+                    "type": "string",
+                    "description": "The name of the branch to pull (default: current branch)."
+                },
+                "remote": {
+                    "type": "string",
+                    "description": "The name of the remote repository (default: 'origin')."
                 }
             }
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
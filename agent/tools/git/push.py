@@ -1,6 +1,9 @@
 import json
+import logging
 import os
-import traceback
+
+logger = logging.getLogger(__name__)
+
 
 def push(remote: str = 'origin', branch: str = None, force: bool = False, set_upstream: bool = False):
     """
@@ -15,7 +18,10 @@ def push(remote: str = 'origin', branch: str = None, force: bool = False, set_up
     Returns:
         str: A JSON string indicating success or an error message.
     """
-    print(f"--- TOOL EXECUTING: push(remote='{remote}', branch='{branch}', force={force}, set_upstream={set_upstream}) ---")
+    logger.debug(
+        "push(remote=%r, branch=%r, force=%s, set_upstream=%s)",
+        remote, branch, force, set_upstream,
+    )
     try:
         # TODO: Implement the actual git push command execution
         # import subprocess
@@ -48,40 +54,43 @@ def push(remote: str = 'origin', branch: str = None, force: bool = False, set_up
         })
 
     except Exception as e:
-        print(f"Error in push: {e}")
-        traceback.print_exc()
+        logger.exception("Error in push")
         return json.dumps({
             "error": str(e),
             "status": "error",
         })
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "push",
-            "description": "Pushes changes to a remote Git repository.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "remote": {
-                        "type": "string",
-                        "description": "The name of the remote repository (default: 'origin')."
-                    },
-                    "branch": {
-                        "type": "string",
-                        "description": "The name of the branch to push (default: current branch)."
-                    },
-                    "force": {
-                        "type": "boolean",
-                        "description": "Forces the push (use with caution)."
-                    },
-                    "set_upstream": {
-                        "type": "boolean",
-                        "description": "Sets the upstream for the branch."
-                    }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "push",
+        "description": "Pushes changes to a remote Git repository.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "remote": {
+                    "type": "string",
+                    "description": "The name of the remote repository (default: 'origin')."
+                },
+                "branch": {
+                    "type": "string",
+                    "description": "The name of the branch to push (default: current branch)."
                 },
-                "required": [],
-            }
+                "force": {
+                    "type": "boolean",
+                    "description": "Forces the push (use with caution)."
+                },
+                "set_upstream": {
+                    "type": "boolean",
+                    "description": "Sets the upstream for the branch."
+                }
+            },
+            "required": [],
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -1,55 +1,152 @@
-import json
-import os
-import traceback
-import git # Import the git library
+import functools
+import logging
 
+from agent.tools.git._repo_cache import get_repo
+from agent.tools.git._worktree import get_worktree_info
+from agent.tools.shared.json_utils import json_tool
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pygit2():
+    """
+    Import pygit2 on first use.
+
+    Returns:
+        module or None: The pygit2 module, or None if it is not installed
+    """
+    try:
+        import pygit2
+    except ImportError:  # libgit2 bindings are optional
+        return None
+    return pygit2
+
+
+def _status_pygit2(pygit2, root):
+    """
+    Collect status in a single libgit2 call.
+
+    Args:
+        pygit2 (module): The imported pygit2 module
+        root (str): Path to the working tree root
+
+    Returns:
+        dict: Sorted lists of staged, unstaged, untracked and conflicted paths
+    """
+    # GIT_STATUS_CONFLICTED is 1 << 15 in libgit2; older pygit2 releases
+    # do not export it
+    conflicted_flag = getattr(pygit2, "GIT_STATUS_CONFLICTED", 1 << 15)
+    index_flags = (
+        pygit2.GIT_STATUS_INDEX_NEW
+        | pygit2.GIT_STATUS_INDEX_MODIFIED
+        | pygit2.GIT_STATUS_INDEX_DELETED
+        | pygit2.GIT_STATUS_INDEX_RENAMED
+        | pygit2.GIT_STATUS_INDEX_TYPECHANGE
+    )
+    worktree_flags = (
+        pygit2.GIT_STATUS_WT_MODIFIED
+        | pygit2.GIT_STATUS_WT_DELETED
+        | pygit2.GIT_STATUS_WT_RENAMED
+        | pygit2.GIT_STATUS_WT_TYPECHANGE
+    )
+
+    staged_changes = []
+    unstaged_changes = []
+    untracked_files = []
+    conflicted_files = []
+    for path, flags in pygit2.Repository(root).status().items():
+        # An unmerged path is reported only as conflicted, as git status does
+        if flags & conflicted_flag:
+            conflicted_files.append(path)
+            continue
+        if flags & index_flags:
+            staged_changes.append(path)
+        if flags & worktree_flags:
+            unstaged_changes.append(path)
+        if flags & pygit2.GIT_STATUS_WT_NEW:
+            untracked_files.append(path)
+
+    return {
+        "staged": sorted(staged_changes),
+        "unstaged": sorted(unstaged_changes),
+        "untracked": sorted(untracked_files),
+        "conflicted": sorted(conflicted_files),
+    }
+
+def _status_gitpython(root):
+    """
+    Collect status with GitPython, used when pygit2 is not installed.
+
+    Args:
+        root (str): Path to the working tree root
+
+    Returns:
+        dict: Sorted lists of staged, unstaged, untracked and conflicted
+        paths, in the same shape as _status_pygit2()
+    """
+    repo = get_repo(root)
+
+    # unmerged paths have higher-stage index entries; like the pygit2 path,
+    # they are reported only as conflicted
+    conflicted_files = {str(path) for path in repo.index.unmerged_blobs()}
+    # unstaged changes: compare index with working directory
+    unstaged_changes = {diff.a_path or diff.b_path for diff in repo.index.diff(None)}
+    # staged changes: compare index with HEAD
+    staged_changes = {diff.a_path or diff.b_path for diff in repo.index.diff("HEAD")}
+    # untracked files
+    untracked_files = repo.untracked_files
+
+    return {
+        "staged": sorted(staged_changes - conflicted_files),
+        "unstaged": sorted(unstaged_changes - conflicted_files),
+        "untracked": sorted(untracked_files),
+        "conflicted": sorted(conflicted_files),
+    }
+
+@json_tool
 def status():
     """
-    Retrieves the Git repository status using GitPython.
+    Retrieves the Git repository status, using pygit2 (libgit2) when it is
+    installed and GitPython otherwise.
 
     Returns:
         str: A JSON string containing the status or an error message.
     """
-    print("--- TOOL EXECUTING: status() ---")
+    logger.debug("status()")
     try:
-        repo = git.Repo('.') # Instantiate a Repo object for the current directory
-
-        # Get changes
-        # unstaged changes: compare index with working directory
-        unstaged_changes = [diff.a_path for diff in repo.index.diff(None)]
-        # staged changes: compare index with HEAD
-        staged_changes = [diff.a_path for diff in repo.index.diff("HEAD")]
-        # untracked files
-        untracked_files = repo.untracked_files
-
-        changes = {
-            "staged": staged_changes,
-            "unstaged": unstaged_changes,
-            "untracked": untracked_files
-        }
+        root = get_worktree_info().root
+        pygit2 = _load_pygit2()
+        if pygit2 is not None:
+            changes = _status_pygit2(pygit2, root)
+        else:
+            changes = _status_gitpython(root)
 
-        return json.dumps({
+        return {
             "status": "success",
             "changes": changes
-        })
+        }
 
     except Exception as e:
-        print(f"Error in status: {e}")
-        traceback.print_exc()
-        return json.dumps({
+        logger.exception("Error in status")
+        return {
             "error": str(e),
             "status": "error",
-        })
+        }
 
-def get_tool_definition():
-    return {
-        "type": "function",
-        "function": {
-            "name": "status",
-            "description": "Retrieves the Git repository status.",
-            "parameters": {
-                "type": "object",
-                "properties": {}
-            }
+
+_TOOL_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "status",
+        "description": "Retrieves the Git repository status.",
+        "parameters": {
+            "type": "object",
+            "properties": {}
         }
     }
+}
+
+
+def get_tool_definition():
+    return _TOOL_DEFINITION
@@ -2,104 +2,268 @@
 
 This module provides functionality to parse .gitignore files and check if paths match gitignore patterns.
 """
-import os
+import collections
 import fnmatch
+import functools
+import os
+import re
+
+# Patterns used when no .gitignore exists or it cannot be read
+DEFAULT_PATTERNS = [
+    "venv/",
+    "__pycache__/",
+    "*.pyc",
+    "*.pyo",
+    ".git/",
+    "*.egg-info/",
+    "*.egg",
+    "dist/",
+    "build/",
+    ".env"
+]
+
+# Characters that make a pattern a glob rather than a literal path
+_GLOB_CHARS = frozenset("*?[")
+
+# Parsed form of a .gitignore file:
+# - patterns: the raw patterns, as written in the file
+# - names: patterns without trailing slash, for exact name matches
+# - file_literals / dir_literals: wildcard-free patterns that can match
+#   files / directories, tested with a set lookup
+# - file_globs / dir_globs: wildcard patterns that can match files /
+#   directories (directories match both kinds), as built by _bucket_globs
+# - negated: the "!pattern" re-inclusions, compiled the same way, or None
+class CompiledPatterns(collections.namedtuple(
+        "CompiledPatterns",
+        ["patterns", "names", "file_literals", "dir_literals",
+         "file_globs", "dir_globs", "negated"])):
+    # Hash and compare by identity: instances are shared through the
+    # parse_gitignore cache and used as keys of the is_ignored cache
+    __slots__ = ()
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+
+    def is_ignored(self, path, is_dir=None):
+        """Checks a path against these patterns; see is_ignored()."""
+        return is_ignored(path, self, is_dir)
+
+    def is_ignored_entry(self, entry, rel_dir=""):
+        """Checks an os.scandir() entry against these patterns; see is_ignored_entry()."""
+        return is_ignored_entry(entry, self, rel_dir)
+
+def _combine(translated):
+    """Fuses translated fnmatch patterns into a single regex, or None if empty."""
+    if not translated:
+        return None
+    # Each fnmatch.translate() result is already anchored with \Z
+    return re.compile("|".join(translated))
+
+def _min_length(pattern):
+    """Returns a lower bound on the length of any name matching a glob pattern."""
+    # Bracket expressions are hard to size exactly; only count the part
+    # before the first one, which is always a safe lower bound
+    head = pattern.split("[", 1)[0]
+    return len(head) - head.count("*")
+
+def _bucket_globs(globs):
+    """Groups glob patterns by their first character for cheap rejection.
 
-def parse_gitignore(base_dir):
-    """Parses a .gitignore file and returns a list of patterns to ignore.
-    
     Args:
-        base_dir (str): Directory where .gitignore is located
-        
+        globs (list): (normalized pattern, fnmatch translation) pairs
+
+    Returns:
+        tuple: (by_first, any_first), where by_first maps a literal first
+        character to (min_len, regex) and any_first is (min_len, regex) for
+        the patterns starting with a wildcard, or None
+    """
+    grouped = collections.defaultdict(list)
+    for pattern, translated in globs:
+        first = pattern[0] if pattern[0] not in _GLOB_CHARS else None
+        grouped[first].append((pattern, translated))
+
+    buckets = {
+        first: (
+            min(_min_length(pattern) for pattern, _ in members),
+            _combine([translated for _, translated in members]),
+        )
+        for first, members in grouped.items()
+    }
+    any_first = buckets.pop(None, None)
+    return buckets, any_first
+
+def _compile_patterns(patterns):
+    """Compiles gitignore patterns into literal sets and combined regexes.
+
+    Args:
+        patterns (list): Raw gitignore patterns
+
     Returns:
-        list: List of patterns from the .gitignore file
+        CompiledPatterns: The combined form used by is_ignored
     """
+    names = set()
+    file_literals = set()
+    dir_literals = set()
+    file_globs = []
+    dir_globs = []
+    negated = []
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            negated.append(pattern[1:])
+            continue
+        if pattern.startswith(("\\!", "\\#")):
+            # Escaped leading "!" or "#" is a literal character
+            pattern = pattern[1:]
+        is_dir_pattern = pattern.endswith("/")
+        if is_dir_pattern:
+            pattern = pattern[:-1]
+        names.add(pattern)
+        normalized = os.path.normcase(pattern)
+
+        if _GLOB_CHARS.isdisjoint(normalized):
+            dir_literals.add(normalized)
+            if not is_dir_pattern:
+                file_literals.add(normalized)
+        elif normalized:
+            glob = (normalized, fnmatch.translate(normalized))
+            dir_globs.append(glob)
+            if not is_dir_pattern:
+                file_globs.append(glob)
+
+    return CompiledPatterns(
+        tuple(patterns),
+        frozenset(names),
+        frozenset(file_literals),
+        frozenset(dir_literals),
+        _bucket_globs(file_globs),
+        _bucket_globs(dir_globs),
+        _compile_patterns(negated) if negated else None,
+    )
+
+@functools.lru_cache(maxsize=32)
+def _parse_gitignore_cached(gitignore_path, stamp):
     patterns = []
-    gitignore_path = os.path.join(base_dir, ".gitignore")
-    
-    if not os.path.exists(gitignore_path):
+
+    if stamp is None:
         # Add default patterns that should be ignored
-        patterns.extend([
-            "venv/",
-            "__pycache__/",
-            "*.pyc",
-            "*.pyo",
-            ".git/",
-            "*.egg-info/",
-            "*.egg",
-            "dist/",
-            "build/",
-            ".env"
-        ])
-        return patterns
-    
-    try:
-        with open(gitignore_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-    except Exception as e:
-        print(f"Error parsing .gitignore file: {e}")
-        # Use default patterns as fallback
-        patterns.extend([
-            "venv/",
-            "__pycache__/",
-            "*.pyc",
-            "*.pyo",
-            ".git/",
-            "*.egg-info/",
-            "*.egg",
-            "dist/",
-            "build/",
-            ".env"
-        ])
-    
+        patterns.extend(DEFAULT_PATTERNS)
+    else:
+        try:
+            with open(gitignore_path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        patterns.append(line)
+        except Exception as e:
+            print(f"Error parsing .gitignore file: {e}")
+            # Use default patterns as fallback
+            patterns.extend(DEFAULT_PATTERNS)
+
     # Ensure venv is in the patterns
     if "venv/" not in patterns and "venv" not in patterns:
         patterns.append("venv/")
-    
-    return patterns
 
-def is_ignored(path, patterns):
+    return _compile_patterns(patterns)
+
+def parse_gitignore(base_dir):
+    """Parses a .gitignore file and returns its patterns in compiled form.
+
+    Results are cached per .gitignore path, modification time and size, so
+    repeated calls only re-read the file after it changes.
+
+    Args:
+        base_dir (str): Directory where .gitignore is located
+        
+    Returns:
+        CompiledPatterns: The patterns from the .gitignore file, with all of
+        them fused into combined regexes
+    """
+    gitignore_path = os.path.join(base_dir, ".gitignore")
+    try:
+        st = os.stat(gitignore_path)
+        # The size catches edits made within the filesystem's mtime granularity
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+
+    return _parse_gitignore_cached(gitignore_path, stamp)
+
+def is_ignored(path, patterns, is_dir=None):
     """Checks if a path should be ignored based on gitignore patterns.
+
+    Results are memoized per (path, is_dir, patterns).
     
     Args:
         path (str): Path to check
-        patterns (list): List of gitignore patterns
+        patterns (CompiledPatterns): Patterns as returned by parse_gitignore
+        is_dir (bool, optional): Whether the path is a directory. Pass it when
+            already known (e.g. from os.walk) to skip a stat() call.
         
     Returns:
         bool: True if the path should be ignored, False otherwise
     """
-    # Convert path to relative path for matching
-    name = os.path.basename(path)
-    
-    for pattern in patterns:
-        # Handle directory-specific patterns
-        is_dir_pattern = pattern.endswith("/")
+    if is_dir is None:
         is_dir = os.path.isdir(path)
-        
-        # Strip trailing slash for matching
-        if is_dir_pattern:
-            pattern = pattern[:-1]
-        
-        # Direct name match
-        if pattern == name:
-            return True
-        
-        # Directory match only applies to directories
-        if is_dir_pattern and not is_dir:
-            continue
-            
-        # Handle simple wildcard patterns
-        if fnmatch.fnmatch(name, pattern):
+    return _is_ignored_cached(path, is_dir, patterns)
+
+@functools.lru_cache(maxsize=8192)
+def _is_ignored_cached(path, is_dir, patterns):
+    if not _matches(path, is_dir, patterns):
+        return False
+    # A matching "!pattern" re-includes the path. Unlike git, which lets
+    # the last matching line win, any re-inclusion overrides any exclusion.
+    negated = patterns.negated
+    return negated is None or not _matches(path, is_dir, negated)
+
+def _matches(path, is_dir, patterns):
+    # Direct name match
+    if os.path.basename(path) in patterns.names:
+        return True
+
+    # Directory patterns only apply to directories
+    if is_dir:
+        literals, (by_first, any_first) = patterns.dir_literals, patterns.dir_globs
+    else:
+        literals, (by_first, any_first) = patterns.file_literals, patterns.file_globs
+
+    # Check if the path, or any trailing part of it, matches a pattern.
+    # Literal patterns are a set lookup; wildcard patterns are only run
+    # through a regex when their first character and minimum length allow a
+    # match. Subpaths are built from the name outwards, one part at a time,
+    # instead of re-joining the tail of the path for every subpath.
+    sep = os.path.sep
+    path_parts = os.path.normcase(path).split(sep)
+    subpath = path_parts.pop()
+    while True:
+        if subpath in literals:
             return True
-        
-        # Check if any part of the path matches the pattern
-        path_parts = path.split(os.path.sep)
-        for i in range(len(path_parts)):
-            subpath = os.path.sep.join(path_parts[i:])
-            if fnmatch.fnmatch(subpath, pattern):
+        if subpath:
+            bucket = by_first.get(subpath[0])
+            if bucket is not None and len(subpath) >= bucket[0] and bucket[1].match(subpath):
+                return True
+            if any_first is not None and len(subpath) >= any_first[0] and any_first[1].match(subpath):
                 return True
-            
-    return False
+        if not path_parts:
+            return False
+        subpath = path_parts.pop() + sep + subpath
+
+def is_ignored_entry(entry, patterns, rel_dir=""):
+    """Checks if an os.scandir() entry should be ignored.
+
+    The directory check uses the type cached on the DirEntry by readdir,
+    so in the common case no stat() call is made.
+
+    Args:
+        entry (os.DirEntry): Entry to check
+        patterns (CompiledPatterns): Patterns as returned by parse_gitignore
+        rel_dir (str): Path of the entry's directory relative to the
+            directory the patterns apply to
+
+    Returns:
+        bool: True if the entry should be ignored, False otherwise
+    """
+    return is_ignored(
+        os.path.join(rel_dir, entry.name),
+        patterns,
+        is_dir=entry.is_dir(follow_symlinks=False),
+    )
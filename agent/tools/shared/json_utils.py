@@ -0,0 +1,53 @@
+"""JSON serialization utilities for the AI agent.
+
+This module provides the single place where tool results are serialized, using
+orjson when it is installed and the standard library otherwise.
+"""
+import functools
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# json.dumps() builds a new JSONEncoder whenever it is given non-default
+# options, so the compact fallback encoder is built once
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def dumps(obj):
+    """Serializes an object to a compact JSON string.
+
+    Args:
+        obj: A JSON-serializable object
+
+    Returns:
+        str: The JSON encoding of obj, without insignificant whitespace
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys, big ints); fall through
+            pass
+    return _COMPACT_ENCODER.encode(obj)
+
+
+def json_tool(func):
+    """Decorator that serializes a tool function's dict result to JSON.
+
+    Tool implementations return plain dicts and the decorator encodes the
+    result once, at the tool boundary.
+
+    Args:
+        func (callable): Tool function returning a JSON-serializable object
+
+    Returns:
+        callable: Wrapped function returning a JSON string
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return dumps(func(*args, **kwargs))
+
+    return wrapper
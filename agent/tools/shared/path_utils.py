@@ -3,11 +3,22 @@ Path utilities for the AI agent.
 
 This module provides path resolution and manipulation utilities.
 """
+import functools
 import os
+import re
+import uuid
 
 # Global variable to store the focus path across the application
 # This will be set by agent.py and used by tool functions
 FOCUS_PATH = None
+# Containment key of FOCUS_PATH (see _containment_key), computed in set_focus_path
+_FOCUS_KEY = None
+# Cached (cwd, containment key of cwd), filled on first use and cleared by
+# reset_path_cache
+_CACHED_CWD = None
+# Name of a directory that delete_directory renamed aside and is removing in
+# the background: ".<name>.deleting-<uuid hex>"
+_PENDING_DELETION_RE = re.compile(r"\..+\.deleting-[0-9a-f]{32}\Z")
 
 def set_focus_path(path):
     """
@@ -15,10 +26,100 @@ def set_focus_path(path):
     Args:
         path (str): The absolute path to the directory to focus on
     """
-    global FOCUS_PATH
+    global FOCUS_PATH, _FOCUS_KEY
     FOCUS_PATH = path
+    _FOCUS_KEY = _containment_key(path) if path else None
+    reset_path_cache()
     print(f"Focus path set to: {FOCUS_PATH}")
     
+def reset_path_cache():
+    """
+    Clear the cached working directory, e.g. after os.chdir()
+    """
+    global _CACHED_CWD
+    _CACHED_CWD = None
+    _resolve_cached.cache_clear()
+
+def _containment_key(base_dir):
+    """
+    Precompute what is_within_dir compares paths against
+    Args:
+        base_dir (str): The directory paths must stay within
+    Returns:
+        tuple: (normalized base_dir, the same with a trailing separator)
+    """
+    base = os.path.normcase(os.path.abspath(base_dir))
+    return base, os.path.join(base, "")
+
+def _is_within_key(path, key):
+    path = os.path.normcase(path)
+    return path == key[0] or path.startswith(key[1])
+
+def _get_cwd():
+    """
+    Get the current working directory, calling os.getcwd() only once
+    Returns:
+        tuple: (cwd, containment key of cwd)
+    """
+    global _CACHED_CWD
+    if _CACHED_CWD is None:
+        cwd = os.getcwd()
+        _CACHED_CWD = (cwd, _containment_key(cwd))
+    return _CACHED_CWD
+
+def is_within_dir(path, base_dir):
+    """
+    Check whether an absolute, normalized path is base_dir or inside it
+    
+    Whole path components are compared, so '/foo/barbaz' is not inside
+    '/foo/bar'.
+    
+    Args:
+        path (str): The absolute path to check, e.g. from os.path.abspath
+        base_dir (str): The directory the path must stay within
+        
+    Returns:
+        bool: True if path is base_dir or below it
+    """
+    return _is_within_key(path, _containment_key(base_dir))
+
+def pending_deletion_name(name):
+    """
+    Get the hidden name delete_directory renames a directory to before removing it
+
+    Args:
+        name (str): Name of the directory being deleted
+
+    Returns:
+        str: A unique name recognised by is_pending_deletion
+    """
+    return f".{name}.deleting-{uuid.uuid4().hex}"
+
+def is_pending_deletion(name):
+    """
+    Check whether a directory entry is a tree delete_directory is still removing
+
+    Listings skip these so that a deletion in progress is not reported as
+    workspace content.
+
+    Args:
+        name (str): Entry name, without any directory part
+
+    Returns:
+        bool: True if the name was made by pending_deletion_name
+    """
+    return name[:1] == "." and _PENDING_DELETION_RE.match(name) is not None
+
+# Keyed on the base directory as well as the path, so a different focus path
+# or cwd never reuses another base's result
+@functools.lru_cache(maxsize=2048)
+def _resolve_cached(file_path, base_dir, base_key):
+    # Normalize the path; if file_path is already absolute the join keeps it
+    resolved_path = os.path.abspath(os.path.join(base_dir, file_path))
+    # abspath has already collapsed any '..', so a string prefix test against
+    # the base plus a separator is enough; no Path objects are built
+    return resolved_path, base_dir, _is_within_key(resolved_path, base_key)
+
 def get_focus_path():
     """
     Get the currently set focus path
@@ -42,19 +143,15 @@ def resolve_path(file_path, use_focus_path=True):
         - is_in_base_dir: Whether the resolved path is within the base directory
     """
     # Determine the base directory - either focus path or current working directory
-    base_dir = FOCUS_PATH if (use_focus_path and FOCUS_PATH) else os.getcwd()
-    
-    # If file_path is already absolute, use it directly
-    if os.path.isabs(file_path):
-        resolved_path = file_path
+    if use_focus_path and FOCUS_PATH:
+        base_dir = FOCUS_PATH
+        base_key = _FOCUS_KEY
     else:
-        # Otherwise, join it with the base directory
-        resolved_path = os.path.abspath(os.path.join(base_dir, file_path))
-    
-    # Check if the resolved path is within the base directory
-    is_in_base_dir = resolved_path.startswith(base_dir)
+        base_dir, base_key = _get_cwd()
     
-    return resolved_path, base_dir, is_in_base_dir
+    # Repeated resolves of the same path (e.g. a file rewritten in a loop)
+    # are a cache lookup
+    return _resolve_cached(file_path, base_dir, base_key)
 
 def get_relative_path(abs_path, base_dir=None):
     """
@@ -69,6 +166,6 @@ def get_relative_path(abs_path, base_dir=None):
         str: The relative path
     """
     if base_dir is None:
-        base_dir = FOCUS_PATH if FOCUS_PATH else os.getcwd()
+        base_dir = FOCUS_PATH if FOCUS_PATH else _get_cwd()[0]
     
     return os.path.relpath(abs_path, start=base_dir)